@@ -2,18 +2,43 @@
 
 from __future__ import annotations
 
-import hashlib
+import atexit
+import io
 import json
 import logging
 import os
+import random
+import threading
 import time
 from datetime import datetime
-from typing import Any, Dict, NoReturn, Optional, Tuple
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Hashable, NoReturn, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .cache import bookstack_cache
+from .cache import _digest_key, bookstack_cache
 from .metrics import get_metrics_collector
+from .schemas import (
+    _CIRCUIT_FAIL_MAX,
+    _CIRCUIT_RESET_TIMEOUT_SECONDS,
+    _HTTP_BACKOFF_FACTOR,
+    _HTTP_POOL_CONNECTIONS,
+    _HTTP_POOL_MAXSIZE,
+    _HTTP_RETRIES,
+)
+
+try:  # orjson decodes large BookStack payloads considerably faster than stdlib json
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+try:  # requests-toolbelt streams multipart bodies instead of joining them in memory
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:  # pragma: no cover - optional accelerator
+    MultipartEncoder = None
 
 try:  # FastMCP provides ToolError for structured failures
     from fastmcp import ToolError
@@ -66,12 +91,20 @@ def _require_env(var: str) -> str:
     return value
 
 
+# Connection settings are fixed for the life of the process, so the env is
+# read on first use only. lru_cache does not memoise exceptions, so a missing
+# variable keeps raising until it is configured.
+@lru_cache(maxsize=1)
 def _bookstack_base_url() -> str:
-    base = _require_env("BS_URL").rstrip("/")
-    return base
+    return _require_env("BS_URL").rstrip("/")
 
 
+@lru_cache(maxsize=1)
 def _bookstack_headers() -> Dict[str, str]:
+    """Return the BookStack request headers.
+
+    The returned dict is shared between calls; callers must not mutate it.
+    """
     token_id = _require_env("BS_TOKEN_ID")
     token_secret = _require_env("BS_TOKEN_SECRET")
     return {
@@ -80,14 +113,171 @@ def _bookstack_headers() -> Dict[str, str]:
         "Accept": "application/json",
     }
 
-def _tool_error(
-    message: str,
-    *,
-    hint: Optional[str] = None,
-    context: Optional[Dict[str, Any]] = None,
-) -> ToolError:
-    """Create a ToolError with optional hint and serialized context."""
 
+_FORM_HEADERS_MEMO: Tuple[Optional[Dict[str, str]], Dict[str, str]] = (None, {})
+
+
+def _form_headers(headers: Dict[str, str]) -> Dict[str, str]:
+    """Return ``headers`` without Content-Type, for multipart uploads.
+
+    requests must write its own multipart boundary header. The result is
+    memoised against the identity of the (shared, cached) source dict, so
+    the copy is only made once per process.
+    """
+    global _FORM_HEADERS_MEMO
+    source, form = _FORM_HEADERS_MEMO
+    if source is headers:
+        return form
+    form = {key: value for key, value in headers.items() if key != "Content-Type"}
+    _FORM_HEADERS_MEMO = (headers, form)
+    return form
+
+
+def _streaming_multipart(
+    data: Optional[Dict[str, Any]],
+    files: Dict[str, Tuple[str, bytes, str]],
+) -> Any:
+    """Return a MultipartEncoder for ``data``/``files``, or None if unavailable.
+
+    requests assembles ``files=`` uploads into one bytes object, so an image is
+    held twice while it is sent; the encoder reads the parts lazily instead.
+    The encoder can only be read once, so it must not back a retryable request.
+    Field values follow the requests conventions: None is skipped and other
+    scalars are sent as their ``str()``.
+    """
+    if MultipartEncoder is None:
+        return None
+    fields: list[Tuple[str, Any]] = [
+        (key, value if isinstance(value, (str, bytes)) else str(value))
+        for key, value in (data or {}).items()
+        if value is not None
+    ]
+    fields.extend(
+        (key, (filename, io.BytesIO(content), mime_type))
+        for key, (filename, content, mime_type) in files.items()
+    )
+    return MultipartEncoder(fields=fields)
+
+
+class _JitteredRetry(Retry):
+    """Retry policy that randomises backoff so concurrent clients desynchronise.
+
+    ``backoff_jitter`` only exists in urllib3 2.x, so the jitter and the cap
+    are applied here to behave the same on urllib3 1.26.
+    """
+
+    JITTER_RATIO = 0.5
+    MAX_BACKOFF_SECONDS = 20.0
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0.0
+        backoff += random.uniform(0, backoff * self.JITTER_RATIO)
+        return min(backoff, self.MAX_BACKOFF_SECONDS)
+
+
+# Retry objects are immutable (urllib3 derives a new one per attempt), so a
+# single policy is shared by every adapter. POST is deliberately excluded:
+# replaying a create could duplicate pages or books.
+_RETRY_POLICY = _JitteredRetry(
+    total=_HTTP_RETRIES,
+    backoff_factor=_HTTP_BACKOFF_FACTOR,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}),
+    respect_retry_after_header=True,
+    # Hand the final response back so raise_for_status() keeps the HTTP error path.
+    raise_on_status=False,
+)
+
+_SESSION: Optional[requests.Session] = None
+_FETCH_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _build_session(max_retries: Any = _RETRY_POLICY) -> requests.Session:
+    """Create a session with one pooled adapter for both schemes."""
+
+    adapter = HTTPAdapter(
+        pool_connections=_HTTP_POOL_CONNECTIONS,
+        pool_maxsize=_HTTP_POOL_MAXSIZE,
+        max_retries=max_retries,
+    )
+    session = requests.Session()
+    # Token auth is stateless; never carry cookies between unrelated calls.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # Close pooled sockets cleanly on interpreter exit rather than leaving
+    # them to garbage collection.
+    atexit.register(session.close)
+    return session
+
+
+def _get_session() -> requests.Session:
+    """Return the shared session, creating it on first use.
+
+    The session is reused for the lifetime of the process so TCP/TLS
+    connections to BookStack stay warm between tool calls.
+    """
+
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _build_session()
+    return _SESSION
+
+
+def _get_fetch_session() -> requests.Session:
+    """Return the shared session for downloading user-supplied image URLs.
+
+    Kept apart from the BookStack session: it carries no retry policy, so an
+    arbitrary host cannot stall a tool call with retries or Retry-After.
+    """
+
+    global _FETCH_SESSION
+    if _FETCH_SESSION is None:
+        with _SESSION_LOCK:
+            if _FETCH_SESSION is None:
+                _FETCH_SESSION = _build_session(max_retries=0)
+    return _FETCH_SESSION
+
+
+def _encode_json_body(payload: Any) -> bytes:
+    """Serialise an outbound JSON body with orjson."""
+
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _decode_json_response(response: requests.Response) -> Any:
+    """Decode a JSON response body, preferring orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+class _ContextToolError(ToolError):
+    """ToolError that serialises its context only when the message is read.
+
+    Many ToolErrors are caught and re-raised or discarded internally, so the
+    indented JSON dump of a possibly large context is deferred to ``str()``.
+    """
+
+    def __init__(self, message: str, hint: Optional[str], context: Dict[str, Any]):
+        super().__init__(message)
+        self._hint = hint
+        self._context = context
+        self._rendered: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._rendered is None:
+            self._rendered = _format_tool_error(self.args[0], self._hint, self._context)
+        return self._rendered
+
+
+def _format_tool_error(message: str, hint: Optional[str], context: Optional[Dict[str, Any]]) -> str:
     sections: list[str] = [message]
     if hint:
         sections.append(f"Hint: {hint}")
@@ -97,7 +287,20 @@ def _tool_error(
         except TypeError:
             context_blob = str(context)
         sections.append(f"Context:\n{context_blob}")
-    return ToolError("\n".join(sections))
+    return "\n".join(sections)
+
+
+def _tool_error(
+    message: str,
+    *,
+    hint: Optional[str] = None,
+    context: Optional[Dict[str, Any]] = None,
+) -> ToolError:
+    """Create a ToolError with optional hint and serialized context."""
+
+    if context:
+        return _ContextToolError(message, hint, context)
+    return ToolError(_format_tool_error(message, hint, None))
 
 
 def _ensure(
@@ -119,9 +322,9 @@ def _select_cache_bucket(method: str, path: str):
     if method.upper() != "GET":
         return None
 
-    if path.startswith("/api/books") or path.startswith("/api/bookshelves"):
+    if path.startswith(("/api/books", "/api/bookshelves")):
         return bookstack_cache.books
-    if path.startswith("/api/pages") or path.startswith("/api/chapters"):
+    if path.startswith(("/api/pages", "/api/chapters")):
         return bookstack_cache.pages
     if path.startswith("/api/image-gallery"):
         return bookstack_cache.images
@@ -137,13 +340,22 @@ def _cache_ttl_for(path: str) -> float:
         return 900.0  # 15 minutes
     if "/search" in path:
         return 180.0  # 3 minutes
-    if path.startswith("/api/pages") or path.startswith("/api/chapters"):
+    if path.startswith(("/api/pages", "/api/chapters")):
         return 300.0  # 5 minutes
     return 600.0  # default 10 minutes
 
 
-def _build_cache_key(method: str, path: str, params: Optional[Dict[str, Any]], json_payload: Optional[Dict[str, Any]]) -> str:
-    """Create a deterministic cache key for a BookStack request."""
+def _build_cache_key(method: str, path: str, params: Optional[Dict[str, Any]], json_payload: Optional[Dict[str, Any]]) -> Hashable:
+    """Create a deterministic cache key for a BookStack request.
+
+    Body-less requests whose params are plain strings and ints key on the
+    sorted tuple itself; anything else falls back to a digest of the JSON form.
+    """
+
+    if not json_payload and all(
+        type(value) in (str, int) for value in (params or {}).values()
+    ):
+        return (method.upper(), path, tuple(sorted((params or {}).items())))
 
     payload = {
         "method": method.upper(),
@@ -151,8 +363,26 @@ def _build_cache_key(method: str, path: str, params: Optional[Dict[str, Any]], j
         "params": params or {},
         "json": json_payload or {},
     }
+    if orjson is not None:
+        return _digest_key(
+            orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        )
     encoded = json.dumps(payload, sort_keys=True, default=str)
-    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    return _digest_key(encoded.encode("utf-8"))
+
+
+# Endpoint prefixes mapped to cache-tag entity types, with the "/"-suffixed
+# form precomputed. "/api/bookshelves" must be checked before "/api/books".
+_ENTITY_TAG_PREFIXES: Tuple[Tuple[str, str, str], ...] = tuple(
+    (prefix, f"{prefix}/", entity_type)
+    for prefix, entity_type in (
+        ("/api/bookshelves", "bookshelf"),
+        ("/api/books", "book"),
+        ("/api/chapters", "chapter"),
+        ("/api/pages", "page"),
+        ("/api/image-gallery", "image"),
+    )
+)
 
 
 def _cache_tags_for_request(method: str, path: str) -> set[str]:
@@ -161,16 +391,8 @@ def _cache_tags_for_request(method: str, path: str) -> set[str]:
     if method.upper() != "GET":
         return set()
 
-    entity_tag_map = {
-        "/api/bookshelves": "bookshelf",
-        "/api/books": "book",
-        "/api/chapters": "chapter",
-        "/api/pages": "page",
-        "/api/image-gallery": "image",
-    }
-
-    for prefix, entity_type in entity_tag_map.items():
-        if path == prefix or path.startswith(f"{prefix}/"):
+    for prefix, prefix_with_slash, entity_type in _ENTITY_TAG_PREFIXES:
+        if path == prefix or path.startswith(prefix_with_slash):
             tags = {f"entity:{entity_type}", f"collection:{entity_type}"}
             suffix = path[len(prefix):].strip("/")
             if suffix and suffix.isdigit():
@@ -233,7 +455,6 @@ def _handle_bookstack_http_error(
         McpError: Always raises with formatted error message and context
     """
     status = exc.response.status_code if exc.response is not None else "unknown"
-    status_code = status if isinstance(status, int) else 0
     preview: Optional[str] = None
     error_detail = ""
     if exc.response is not None:
@@ -241,7 +462,7 @@ def _handle_bookstack_http_error(
             preview = exc.response.text[:400]
             # Try to extract error message from JSON response
             try:
-                error_json = exc.response.json()
+                error_json = _decode_json_response(exc.response)
                 if isinstance(error_json, dict):
                     if "error" in error_json:
                         error_detail = f": {error_json['error']}"
@@ -273,7 +494,6 @@ def _handle_bookstack_http_error(
         )
 
     error_msg = f"BookStack API request failed with HTTP {status}{error_detail}"
-    error_message = error_msg
     
     # Build context dict based on what was provided
     context: Dict[str, Any] = {
@@ -300,6 +520,114 @@ def _handle_bookstack_http_error(
     raise _tool_error(error_msg, hint=hint, context=context) from exc
 
 
+class _CircuitBreaker:
+    """Short-circuit BookStack calls after repeated transport failures.
+
+    Only connection-level failures count; HTTP error responses prove the API
+    is reachable. Once ``fail_max`` consecutive failures are seen the circuit
+    opens and calls fail immediately. After ``reset_timeout`` seconds the
+    circuit half-opens: one trial request is let through while other callers
+    keep failing fast. Its success closes the circuit and its failure re-opens
+    it; a trial that never reports back is superseded after another timeout.
+    """
+
+    def __init__(self, fail_max: int, reset_timeout: float) -> None:
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def retry_after(self) -> Optional[float]:
+        """Return seconds until a call may be tried, or None if this call may proceed."""
+        with self._lock:
+            if self._opened_at is None:
+                return None
+            now = time.monotonic()
+            remaining = self.reset_timeout - (now - self._opened_at)
+            if remaining > 0:
+                return remaining
+            if self._probe_started is not None:
+                probe_remaining = self.reset_timeout - (now - self._probe_started)
+                if probe_remaining > 0:
+                    return probe_remaining
+            self._probe_started = now
+            return None
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_started = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probe_started is not None or self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+                self._probe_started = None
+
+    def reset(self) -> None:
+        self.record_success()
+
+
+_CIRCUIT_BREAKER = _CircuitBreaker(_CIRCUIT_FAIL_MAX, _CIRCUIT_RESET_TIMEOUT_SECONDS)
+
+
+def _send_request(method: str, path: str, url: str, **kwargs: Any) -> requests.Response:
+    """Send a request on the shared session, raising for HTTP errors and recording metrics."""
+
+    retry_after = _CIRCUIT_BREAKER.retry_after()
+    if retry_after is not None:
+        raise _tool_error(
+            "BookStack API temporarily unavailable",
+            hint=f"Recent requests could not reach BookStack; retry in about {retry_after:.0f} seconds.",
+            context={"method": method, "path": path},
+        )
+
+    collector = get_metrics_collector()
+    start_time = time.perf_counter()
+    status_code = 0
+    error_message: Optional[str] = None
+    try:
+        response = _get_session().request(method, url, **kwargs)
+        status_code = response.status_code
+        _CIRCUIT_BREAKER.record_success()
+        response.raise_for_status()
+        return response
+    except requests.HTTPError as exc:
+        status = exc.response.status_code if exc.response is not None else 0
+        status_code = status if isinstance(status, int) else 0
+        raise
+    except requests.RequestException as exc:
+        error_message = str(exc)
+        _CIRCUIT_BREAKER.record_failure()
+        raise
+    finally:
+        collector.record_request(method, path, time.perf_counter() - start_time, status_code, error_message)
+
+
+def _response_payload(response: requests.Response, method: str, path: str, *, message: str, hint: str) -> Any:
+    """Decode a successful BookStack response, mapping empty bodies to a success marker."""
+
+    if response.status_code == 204 or not response.content:
+        return {"success": True, "status": response.status_code}
+    try:
+        return _decode_json_response(response)
+    except ValueError as exc:  # pragma: no cover - unexpected payload
+        raise _tool_error(
+            message,
+            hint=hint,
+            context={
+                "method": method,
+                "path": path,
+                "status": response.status_code,
+                "raw": response.text[:400],
+            },
+        ) from exc
+
+
 def _bookstack_request(
     method: str,
     path: str,
@@ -313,7 +641,7 @@ def _bookstack_request(
 
     method = method.upper()
     cache_bucket = _select_cache_bucket(method, path)
-    cache_key: Optional[str] = None
+    cache_key: Optional[Hashable] = None
     if cache_bucket is not None:
         cache_key = _build_cache_key(method, path, params, json)
         cached_payload = cache_bucket.get(cache_key)
@@ -333,25 +661,18 @@ def _bookstack_request(
     resolve_base_url = _base_url_fn or _bookstack_base_url
     resolve_headers = _headers_fn or _bookstack_headers
     url = f"{resolve_base_url()}{path}"
-    collector = get_metrics_collector()
-    start_time = time.time()
-    status_code: int = 0
-    error_message: Optional[str] = None
+
+    headers = resolve_headers()
+    body: Dict[str, Any] = {"json": json}
+    if json is not None and orjson is not None:
+        # Encode with orjson rather than letting requests fall back to stdlib json
+        body = {"data": _encode_json_body(json)}
+        if "Content-Type" not in headers:
+            headers = {**headers, "Content-Type": "application/json"}
 
     try:
-        response = requests.request(
-            method,
-            url,
-            headers=resolve_headers(),
-            params=params,
-            json=json,
-            timeout=60,
-        )
-        status_code = response.status_code
-        response.raise_for_status()
+        response = _send_request(method, path, url, headers=headers, params=params, timeout=60, **body)
     except requests.HTTPError as exc:
-        status = exc.response.status_code if exc.response is not None else "unknown"
-        status_code = status if isinstance(status, int) else 0
         _handle_bookstack_http_error(
             exc,
             default_hint="Verify the BookStack credentials, entity identifiers, and payload fields.",
@@ -361,12 +682,11 @@ def _bookstack_request(
             json=json,
         )
     except requests.RequestException as exc:  # pragma: no cover - network failure path
-        error_message = str(exc)
         logger.error(
             "bookstack.transport_error",
             extra={
                 "context": {
-                    "message": error_message,
+                    "message": str(exc),
                     "method": method,
                     "path": path,
                     "params": params,
@@ -378,27 +698,14 @@ def _bookstack_request(
             hint="Check network connectivity and ensure the BS_URL host is reachable from the container.",
             context={"method": method, "path": path, "params": params},
         ) from exc
-    finally:
-        duration = time.time() - start_time
-        # Only record metrics when we actually contacted the API
-        collector.record_request(method, path, duration, status_code, error_message)
 
-    if response.status_code == 204 or not response.content:
-        payload: Any = {"success": True, "status": response.status_code}
-    else:
-        try:
-            payload = response.json()
-        except ValueError as exc:  # pragma: no cover - unexpected payload
-            raise _tool_error(
-                "BookStack API returned a non-JSON response",
-                hint="Inspect the response body to confirm the endpoint and authentication are correct.",
-                context={
-                    "method": method,
-                    "path": path,
-                    "status": response.status_code,
-                    "raw": response.text[:400],
-                },
-            ) from exc
+    payload = _response_payload(
+        response,
+        method,
+        path,
+        message="BookStack API returned a non-JSON response",
+        hint="Inspect the response body to confirm the endpoint and authentication are correct.",
+    )
 
     if cache_bucket is not None and cache_key is not None:
         cache_bucket.set(
@@ -425,18 +732,20 @@ def _bookstack_request_form(
     resolve_base_url = _base_url_fn or _bookstack_base_url
     resolve_headers = _headers_fn or _bookstack_headers
     url = f"{resolve_base_url()}{path}"
-    headers = resolve_headers()
-    headers.pop("Content-Type", None)
+    # Let requests set the multipart boundary; never mutate the shared header dict
+    headers = _form_headers(resolve_headers())
+    # The encoder is a read-once stream urllib3 cannot rewind, so methods the
+    # retry policy may replay (PUT) keep the buffered files= body.
+    method = method.upper()
+    streamable = bool(files) and method not in _RETRY_POLICY.allowed_methods
+    encoder = _streaming_multipart(data, files) if streamable else None
+    if encoder is not None:
+        headers = {**headers, "Content-Type": encoder.content_type}
+        body: Dict[str, Any] = {"data": encoder}
+    else:
+        body = {"data": data, "files": files}
     try:
-        response = requests.request(
-            method,
-            url,
-            headers=headers,
-            data=data,
-            files=files,
-            timeout=120,
-        )
-        response.raise_for_status()
+        response = _send_request(method, path, url, headers=headers, timeout=120, **body)
     except requests.HTTPError as exc:
         _handle_bookstack_http_error(
             exc,
@@ -457,19 +766,10 @@ def _bookstack_request_form(
             context={"method": method, "path": path},
         ) from exc
 
-    if response.status_code == 204 or not response.content:
-        return {"success": True, "status": response.status_code}
-
-    try:
-        return response.json()
-    except ValueError as exc:  # pragma: no cover - unexpected payload
-        raise _tool_error(
-            "BookStack image endpoint returned a non-JSON response",
-            hint="Inspect the raw response to confirm the upload/download succeeded.",
-            context={
-                "method": method,
-                "path": path,
-                "status": response.status_code,
-                "raw": response.text[:400],
-            },
-        ) from exc
+    return _response_payload(
+        response,
+        method,
+        path,
+        message="BookStack image endpoint returned a non-JSON response",
+        hint="Inspect the raw response to confirm the upload/download succeeded.",
+    )
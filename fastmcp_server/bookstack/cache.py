@@ -3,104 +3,210 @@
 from __future__ import annotations
 
 import hashlib
+import itertools
 import json
 import time
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, Set
+from typing import Any, Callable, DefaultDict, Dict, Hashable, Optional, Set
 from functools import wraps
 import threading
+from collections import OrderedDict, defaultdict
+
+try:  # xxhash is an optional accelerator for cache-key digests
+    import xxhash
+except ImportError:  # pragma: no cover - stdlib fallback
+    xxhash = None
+
+try:  # orjson serialises key material straight to bytes
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+_ORJSON_KEY_OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+
+def _digest_key(data: bytes) -> str:
+    """Digest serialised key material into a compact cache key.
+
+    Keys never leave the process, so a fast non-cryptographic 128-bit hash is
+    sufficient when xxhash is installed; SHA-256 is the fallback.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.sha256(data).hexdigest()
 
 
-@dataclass
 class CacheEntry:
-    """Cached response with metadata."""
+    """Cached response with metadata.
+
+    Slotted with a precomputed monotonic deadline so the hit path does a
+    single comparison instead of recomputing the age from wall-clock time.
+    """
+
+    __slots__ = ("data", "expires_at", "hits", "tags")
 
-    data: Any
-    timestamp: float
-    ttl: float
-    hits: int = 0
-    tags: Set[str] | None = None
+    def __init__(self, data: Any, ttl: float, tags: Set[str] | None = None):
+        self.data = data
+        self.expires_at = time.monotonic() + ttl
+        self.hits = 0
+        self.tags = tags
 
     def is_expired(self) -> bool:
         """Check if cache entry has expired."""
-        return time.time() - self.timestamp > self.ttl
+        return time.monotonic() > self.expires_at
 
     def increment_hits(self) -> None:
         """Track cache hit count."""
         self.hits += 1
 
 
+_STAT_NAMES = ("hits", "misses", "evictions", "expired")
+
+
+class _CacheShard:
+    """One lock-protected stripe of a SmartCache."""
+
+    __slots__ = ("lock", "entries", "tag_index", "max_size", "stats")
+
+    def __init__(self, max_size: int):
+        self.lock = threading.Lock()
+        # Ordered oldest-to-newest access so LRU eviction is a popitem()
+        self.entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        # tag -> keys carrying it, so tag invalidation never scans every entry
+        self.tag_index: DefaultDict[str, Set[Hashable]] = defaultdict(set)
+        self.max_size = max_size
+        # Plain counters, only updated while ``lock`` is held
+        self.stats: Dict[str, int] = dict.fromkeys(_STAT_NAMES, 0)
+
+    def put(self, key: Hashable, entry: CacheEntry) -> None:
+        self.pop(key)
+        self.entries[key] = entry
+        for tag in entry.tags or ():
+            self.tag_index[tag].add(key)
+
+    def pop(self, key: Hashable) -> Optional[CacheEntry]:
+        entry = self.entries.pop(key, None)
+        if entry is not None and entry.tags:
+            self._unindex(key, entry.tags)
+        return entry
+
+    def clear(self) -> int:
+        removed = len(self.entries)
+        self.entries.clear()
+        self.tag_index.clear()
+        return removed
+
+    def _unindex(self, key: Hashable, tags: Set[str]) -> None:
+        for tag in tags:
+            keys = self.tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tag_index[tag]
+
+
+# Entries inspected from the LRU end per eviction; bounds the work under the lock
+_EVICTION_WINDOW = 32
+
+
+def _shard_count(max_size: int) -> int:
+    """Pick a stripe count; small caches keep a single exact-LRU shard."""
+    return max(1, min(16, max_size // 128))
+
+
 class SmartCache:
-    """Thread-safe LRU cache with TTL and statistics."""
+    """Thread-safe LRU cache with TTL and statistics.
+
+    Entries are striped across shards by key hash, each with its own lock, so
+    concurrent lookups of unrelated keys do not serialise on one lock. LRU
+    order and ``max_size`` are enforced per shard.
+    """
 
     def __init__(self, max_size: int = 1000, default_ttl: float = 300):
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self._cache: Dict[str, CacheEntry] = {}
-        self._lock = threading.RLock()
-        self._stats = {
-            "hits": 0,
-            "misses": 0,
-            "evictions": 0,
-            "expired": 0,
-        }
+        shard_count = _shard_count(max_size)
+        shard_size = -(-max_size // shard_count)
+        self._shards = tuple(_CacheShard(shard_size) for _ in range(shard_count))
+
+    def _shard_for(self, key: Hashable) -> _CacheShard:
+        return self._shards[hash(key) % len(self._shards)]
     
     def _make_key(self, *args, **kwargs) -> str:
         """Generate cache key from arguments."""
-        key_data = json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True, default=str)
-        return hashlib.sha256(key_data.encode()).hexdigest()
+        key_data = {"args": args, "kwargs": kwargs}
+        if orjson is not None:
+            return _digest_key(orjson.dumps(key_data, default=str, option=_ORJSON_KEY_OPTIONS))
+        return _digest_key(json.dumps(key_data, sort_keys=True, default=str).encode())
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """Retrieve cached value if valid."""
-        with self._lock:
-            entry = self._cache.get(key)
+        shard = self._shard_for(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
             if entry is None:
-                self._stats["misses"] += 1
+                shard.stats["misses"] += 1
                 return None
             
             if entry.is_expired():
-                del self._cache[key]
-                self._stats["expired"] += 1
-                self._stats["misses"] += 1
+                shard.pop(key)
+                shard.stats["expired"] += 1
+                shard.stats["misses"] += 1
                 return None
             
+            shard.entries.move_to_end(key)
             entry.increment_hits()
-            self._stats["hits"] += 1
+            shard.stats["hits"] += 1
             return entry.data
     
     def set(
         self,
-        key: str,
+        key: Hashable,
         value: Any,
         ttl: Optional[float] = None,
         *,
         tags: Optional[Set[str]] = None,
     ) -> None:
         """Store value in cache with TTL."""
-        with self._lock:
-            # Evict oldest entry if cache is full
-            if len(self._cache) >= self.max_size and key not in self._cache:
-                self._evict_lru()
+        shard = self._shard_for(key)
+        with shard.lock:
+            if key not in shard.entries and len(shard.entries) >= shard.max_size:
+                self._evict(shard)
 
-            self._cache[key] = CacheEntry(
+            shard.put(key, CacheEntry(
                 data=value,
-                timestamp=time.time(),
                 ttl=ttl or self.default_ttl,
                 tags=set(tags or ()),
-            )
-    
-    def _evict_lru(self) -> None:
-        """Evict least recently used entry."""
-        if not self._cache:
+            ))
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove a single entry, returning whether it was present."""
+        shard = self._shard_for(key)
+        with shard.lock:
+            return shard.pop(key) is not None
+
+    def _evict(self, shard: _CacheShard) -> None:
+        """Free one slot in the shard, v-LRU style.
+
+        Expired entries near the LRU end are reclaimed first. Otherwise the
+        victim is the least-hit entry among the oldest tenth of the shard, with
+        the soonest expiry breaking ties, so hot entries survive a brief lull.
+        """
+        if not shard.entries:
             return
-        
-        # Find entry with oldest timestamp and lowest hits
-        lru_key = min(
-            self._cache.keys(),
-            key=lambda k: (self._cache[k].hits, self._cache[k].timestamp)
-        )
-        del self._cache[lru_key]
-        self._stats["evictions"] += 1
+
+        window = list(itertools.islice(shard.entries.items(), _EVICTION_WINDOW))
+        now = time.monotonic()
+        expired = [key for key, entry in window if now > entry.expires_at]
+        if expired:
+            for key in expired:
+                shard.pop(key)
+                shard.stats["expired"] += 1
+            return
+
+        candidates = window[: max(1, len(shard.entries) // 10)]
+        victim, _ = min(candidates, key=lambda item: (item[1].hits, item[1].expires_at))
+        shard.pop(victim)
+        shard.stats["evictions"] += 1
     
     def invalidate(
         self,
@@ -108,63 +214,138 @@ class SmartCache:
         *,
         tags: Optional[Set[str]] = None,
     ) -> int:
-        """Invalidate cache entries matching a pattern or tag set."""
-        with self._lock:
-            if pattern is None and not tags:
-                count = len(self._cache)
-                self._cache.clear()
-                return count
-
-            keys_to_delete = []
-            for key, entry in self._cache.items():
-                pattern_match = pattern is not None and pattern in key
-                tag_match = bool(tags and entry.tags and entry.tags.intersection(tags))
-                if pattern_match or tag_match:
-                    keys_to_delete.append(key)
-            for key in keys_to_delete:
-                del self._cache[key]
-            return len(keys_to_delete)
+        """Invalidate cache entries matching a pattern or tag set.
+
+        Tag matches are resolved through the tag index; only a substring
+        ``pattern`` still requires scanning the keys.
+        """
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                if pattern is None and not tags:
+                    removed += shard.clear()
+                    continue
+
+                keys_to_delete: Set[Hashable] = set()
+                for tag in tags or ():
+                    keys_to_delete.update(shard.tag_index.get(tag, ()))
+                if pattern is not None:
+                    keys_to_delete.update(
+                        key for key in shard.entries if isinstance(key, str) and pattern in key
+                    )
+                for key in keys_to_delete:
+                    shard.pop(key)
+                removed += len(keys_to_delete)
+        return removed
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
+        stats = dict.fromkeys(_STAT_NAMES, 0)
+        for shard in self._shards:
+            with shard.lock:
+                for name, value in shard.stats.items():
+                    stats[name] += value
+        total_requests = stats["hits"] + stats["misses"]
+        hit_rate = (stats["hits"] / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            **stats,
+            "size": sum(len(shard.entries) for shard in self._shards),
+            "max_size": self.max_size,
+            "hit_rate": f"{hit_rate:.2f}%",
+            "total_requests": total_requests,
+        }
+
+
+class _Flight:
+    """A call in progress that concurrent callers can wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _SingleFlight:
+    """Collapse concurrent calls for the same key into one execution."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
         with self._lock:
-            total_requests = self._stats["hits"] + self._stats["misses"]
-            hit_rate = (self._stats["hits"] / total_requests * 100) if total_requests > 0 else 0
-            
-            return {
-                **self._stats,
-                "size": len(self._cache),
-                "max_size": self.max_size,
-                "hit_rate": f"{hit_rate:.2f}%",
-                "total_requests": total_requests,
-            }
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
 
 
+# Argument types whose tuple keys are unambiguous: exact types only, so that
+# True, 1 and 1.0 (which hash and compare equal) never share an entry
+_SCALAR_KEY_TYPES = frozenset({str, int, type(None)})
+
 # Global cache instance
 _global_cache = SmartCache(max_size=1000, default_ttl=300)
+_global_flights = _SingleFlight()
 
 
 def cached(ttl: Optional[float] = None, key_prefix: str = ""):
     """Decorator to cache function results."""
     
     def decorator(func: Callable) -> Callable:
+        # Bound once per decorated function; entries are tagged with the
+        # prefix so cache_invalidate() is an index lookup rather than a scan.
+        prefix = f"{key_prefix}:{func.__name__}:"
+        tags = {prefix}
+        make_key = _global_cache._make_key
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Generate cache key
-            cache_key = f"{key_prefix}:{func.__name__}:{_global_cache._make_key(*args, **kwargs)}"
+            # Generate cache key; plain scalar arguments key the entry
+            # directly as a tuple, skipping serialisation and hashing
+            if all(type(arg) in _SCALAR_KEY_TYPES for arg in args) and all(
+                type(value) in _SCALAR_KEY_TYPES for value in kwargs.values()
+            ):
+                cache_key: Hashable = (prefix, args, tuple(sorted(kwargs.items())))
+            else:
+                cache_key = prefix + make_key(*args, **kwargs)
             
             # Try to get from cache
             cached_value = _global_cache.get(cache_key)
             if cached_value is not None:
                 return cached_value
             
-            # Execute function and cache result
-            result = func(*args, **kwargs)
-            _global_cache.set(cache_key, result, ttl)
-            return result
+            # Execute function and cache result; concurrent misses for the
+            # same key wait for this call instead of repeating it
+            def fill():
+                result = func(*args, **kwargs)
+                _global_cache.set(cache_key, result, ttl, tags=tags)
+                return result
+
+            return _global_flights.do(cache_key, fill)
         
         # Add cache control methods
-        wrapper.cache_invalidate = lambda: _global_cache.invalidate(f"{key_prefix}:{func.__name__}")  # type: ignore[attr-defined]
+        wrapper.cache_invalidate = lambda: _global_cache.invalidate(tags=tags)  # type: ignore[attr-defined]
         wrapper.cache_stats = lambda: _global_cache.get_stats()  # type: ignore[attr-defined]
         
         return wrapper
@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 import json
-import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
-from .api_client import _tool_error, _ensure, logger, ToolError
+from .api_client import _tool_error, _ensure
 from .schemas import (
     EntityType,
     OperationType,
     PreparedOperation,
     TagDict,
     FilterEntry,
-    _CONTENT_KNOWN_FIELDS,
+    _CONTENT_KNOWN_FIELDS_SET,
     _ENTITY_BASE_PATHS,
     _HTML_TAG_RE,
+    _WHITESPACE_RE,
 )
 from .validators import BookStackValidator, InputValidator, ValidationError
 
@@ -119,13 +120,18 @@ def _coerce_json_object(
     value: Optional[Any],
     *,
     label: str,
+    copy: bool = True,
 ) -> Dict[str, Any]:
-    """Return a dictionary parsed from a mapping or JSON string."""
+    """Return a dictionary parsed from a mapping or JSON string.
+
+    Mappings are shallow-copied unless ``copy`` is false; pass ``copy=False``
+    only when the caller does not mutate the result or copies it itself.
+    """
 
     if value is None:
         return {}
     if isinstance(value, dict):
-        return dict(value)
+        return dict(value) if copy else value
     if isinstance(value, str):
         text = value.strip()
         if not text:
@@ -144,7 +150,7 @@ def _coerce_json_object(
                 hint="Wrap the payload in curly braces when supplying a string.",
                 context={"received": parsed},
             )
-        return dict(parsed)
+        return parsed
     raise _tool_error(
         f"{label} must be an object or JSON string",
         context={"received_type": type(value).__name__},
@@ -210,18 +216,31 @@ def _normalise_books(collection: Optional[Sequence[Any]]) -> Optional[list[int]]
     return [_validate_positive_int(item, "Book ID") for item in collection]
 
 
+def _tag_text(value: Any) -> str:
+    return value if type(value) is str else str(value)
+
+
 def _format_tags(tags: Optional[Sequence[TagDict]]) -> Optional[list[TagDict]]:
     """Return tags in the shape expected by BookStack, or None if absent."""
     if tags is None:
         return None
-    normalised: list[Dict[str, str]] = []
-    for tag in tags:
-        if isinstance(tag, dict):
-            normalised.append({"name": str(tag.get("name", "")), "value": str(tag.get("value", ""))})
-        else:
-            name = getattr(tag, "name", "")
-            value = getattr(tag, "value", "")
-            normalised.append({"name": str(name), "value": str(value)})
+    normalised: list[Dict[str, str]]
+    if all(isinstance(tag, dict) for tag in tags):
+        # Common case: plain JSON objects, so no per-item type dispatch.
+        normalised = [
+            {"name": _tag_text(tag.get("name", "")), "value": _tag_text(tag.get("value", ""))}
+            for tag in tags
+        ]
+    else:
+        normalised = []
+        for tag in tags:
+            if isinstance(tag, dict):
+                name = tag.get("name", "")
+                value = tag.get("value", "")
+            else:
+                name = getattr(tag, "name", "")
+                value = getattr(tag, "value", "")
+            normalised.append({"name": _tag_text(name), "value": _tag_text(value)})
 
     try:
         validated = BookStackValidator.validate_tags(normalised)
@@ -237,22 +256,11 @@ def _format_tags(tags: Optional[Sequence[TagDict]]) -> Optional[list[TagDict]]:
 
 def _compact_payload(data: Dict[str, Any]) -> Dict[str, Any]:
     """Remove keys with None values or empty strings."""
-    compacted: Dict[str, Any] = {}
-    for key, value in data.items():
-        if value is None:
-            continue
-        if isinstance(value, str) and value == "":
-            continue
-        compacted[key] = value
-    return compacted
+    return {key: value for key, value in data.items() if value is not None and value != ""}
 
 
 def _extract_known_fields(data: Dict[str, Any]) -> Dict[str, Any]:
-    extracted: Dict[str, Any] = {}
-    for field in _CONTENT_KNOWN_FIELDS:
-        if field in data:
-            extracted[field] = data[field]
-    return extracted
+    return {field: data[field] for field in data.keys() & _CONTENT_KNOWN_FIELDS_SET}
 
 
 def _filter_collection(
@@ -265,43 +273,102 @@ def _filter_collection(
         return data, None
 
     if isinstance(data, dict) and isinstance(data.get("data"), list):
-        original_items = data["data"]
-        filtered_items = [item for item in original_items if predicate(item)]
+        filtered_items = list(filter(predicate, data["data"]))
         match_count = len(filtered_items)
-        new_payload = dict(data)
-        new_payload["data"] = filtered_items
-        if "count" in new_payload:
-            new_payload["count"] = match_count
-        return new_payload, match_count
+        # Build a new envelope; the original may be a shared cache entry
+        if "count" in data:
+            return {**data, "data": filtered_items, "count": match_count}, match_count
+        return {**data, "data": filtered_items}, match_count
 
     if isinstance(data, list):
-        filtered_items = [item for item in data if predicate(item)]
+        filtered_items = list(filter(predicate, data))
         return filtered_items, len(filtered_items)
 
     return data, None
 
 
+_FILTER_ENTRY_HINT = "Provide each filter entry as {'key': 'field', 'value': 'match'}."
+
+
 def _normalise_filters(filters: Optional[Sequence[FilterEntry]]) -> Optional[list[Tuple[str, str]]]:
     if filters is None:
         return None
     normalised: list[Tuple[str, str]] = []
+    append = normalised.append
     for entry in filters:
-        key = _normalise_str(entry.get("key")) if isinstance(entry, dict) else None
-        value = entry.get("value") if isinstance(entry, dict) else None
+        if not isinstance(entry, dict):
+            raise _tool_error("Filter entries require a non-empty 'key'", hint=_FILTER_ENTRY_HINT)
+        key = _normalise_str(entry.get("key"))
         if not key:
-            raise _tool_error(
-                "Filter entries require a non-empty 'key'",
-                hint="Provide each filter entry as {'key': 'field', 'value': 'match'}.",
-            )
+            raise _tool_error("Filter entries require a non-empty 'key'", hint=_FILTER_ENTRY_HINT)
+        value = entry.get("value")
         if value is None:
-            raise _tool_error(
-                "Filter entries require a 'value'",
-                hint="Provide each filter entry as {'key': 'field', 'value': 'match'}.",
-            )
-        normalised.append((key, str(value)))
+            raise _tool_error("Filter entries require a 'value'", hint=_FILTER_ENTRY_HINT)
+        append((key, str(value)))
     return normalised
 
 
+def _apply_shelf_books(payload: Dict[str, Any], books: Optional[Sequence[Any]]) -> None:
+    """Set validated shelf book IDs, preferring the explicit argument."""
+    normalised_books = _normalise_books(books if books is not None else payload.get("books"))
+    if normalised_books is not None:
+        payload["books"] = normalised_books
+    else:
+        payload.pop("books", None)
+
+
+def _apply_priority(payload: Dict[str, Any], priority: Optional[Any]) -> None:
+    """Set a validated priority, preferring the explicit argument."""
+    priority_value = _optional_non_negative_int(
+        priority if priority is not None else payload.get("priority"),
+        "'priority'",
+    )
+    if priority_value is not None:
+        payload["priority"] = priority_value
+    else:
+        payload.pop("priority", None)
+
+
+def _apply_page_body(
+    payload: Dict[str, Any],
+    *,
+    markdown: Optional[str],
+    html: Optional[str],
+    content: Optional[str],
+    hint: str,
+    context: Dict[str, Any],
+) -> None:
+    """Resolve a page's markdown/html body; explicit arguments win, content aliases markdown."""
+    markdown_value = payload.get("markdown")
+    html_value = payload.get("html")
+    if markdown is not None:
+        markdown_value = markdown
+    elif content is not None and markdown_value is None:
+        markdown_value = content
+    if html is not None:
+        html_value = html
+
+    if isinstance(markdown_value, str):
+        markdown_value = _validated_markdown(_normalise_str(markdown_value))
+    if isinstance(html_value, str):
+        html_value = _validated_html(_normalise_str(html_value))
+
+    if markdown_value and html_value:
+        raise _tool_error(
+            "Provide either markdown/content or html, not both",
+            hint=hint,
+            context=context,
+        )
+    if markdown_value is not None:
+        payload["markdown"] = markdown_value
+    else:
+        payload.pop("markdown", None)
+    if html_value is not None:
+        payload["html"] = html_value
+    else:
+        payload.pop("html", None)
+
+
 def _build_content_operation(
     operation: OperationType,
     entity_type: EntityType,
@@ -353,12 +420,7 @@ def _build_content_operation(
             description_value = _normalise_str(description) or _normalise_str(payload.get("description"))
             if description_value is not None:
                 payload["description"] = _validated_description(description_value, entity_type)
-            shelf_books = books if books is not None else payload.get("books")
-            normalised_books = _normalise_books(shelf_books)
-            if normalised_books is not None:
-                payload["books"] = normalised_books
-            else:
-                payload.pop("books", None)
+            _apply_shelf_books(payload, books)
 
         elif entity_type == "chapter":
             chapter_book_id = payload.get("book_id") if payload.get("book_id") is not None else book_id
@@ -366,12 +428,7 @@ def _build_content_operation(
             description_value = _normalise_str(description) or _normalise_str(payload.get("description"))
             if description_value is not None:
                 payload["description"] = _validated_description(description_value, entity_type)
-            chapter_priority = priority if priority is not None else payload.get("priority")
-            priority_value = _optional_non_negative_int(chapter_priority, "'priority'")
-            if priority_value is not None:
-                payload["priority"] = priority_value
-            else:
-                payload.pop("priority", None)
+            _apply_priority(payload, priority)
 
         elif entity_type == "page":
             raw_page_book_id = payload.get("book_id") if payload.get("book_id") is not None else book_id
@@ -395,41 +452,16 @@ def _build_content_operation(
             else:
                 payload.pop("chapter_id", None)
 
-            markdown_value = payload.get("markdown")
-            html_value = payload.get("html")
-            if markdown is not None:
-                markdown_value = markdown
-            elif content is not None and markdown_value is None:
-                markdown_value = content
-            if html is not None:
-                html_value = html
-
-            if isinstance(markdown_value, str):
-                markdown_value = _validated_markdown(_normalise_str(markdown_value))
-            if isinstance(html_value, str):
-                html_value = _validated_html(_normalise_str(html_value))
-
-            if markdown_value and html_value:
-                raise _tool_error(
-                    "Provide either markdown/content or html, not both",
-                    hint="Supply only one of 'markdown'/'content' or 'html' for a page.",
-                    context={"operation": operation, "entity_type": entity_type},
-                )
-            if markdown_value is not None:
-                payload["markdown"] = markdown_value
-            else:
-                payload.pop("markdown", None)
-            if html_value is not None:
-                payload["html"] = html_value
-            else:
-                payload.pop("html", None)
+            _apply_page_body(
+                payload,
+                markdown=markdown,
+                html=html,
+                content=content,
+                hint="Supply only one of 'markdown'/'content' or 'html' for a page.",
+                context={"operation": operation, "entity_type": entity_type},
+            )
 
-            page_priority = priority if priority is not None else payload.get("priority")
-            priority_value = _optional_non_negative_int(page_priority, "'priority'")
-            if priority_value is not None:
-                payload["priority"] = priority_value
-            else:
-                payload.pop("priority", None)
+            _apply_priority(payload, priority)
 
         else:  # pragma: no cover - exhaustive guard
             raise _tool_error(
@@ -459,20 +491,13 @@ def _build_content_operation(
                 payload["image_id"] = _validate_positive_int(image_value, "'image_id'")
 
         elif entity_type == "bookshelf":
-            shelf_books = books if books is not None else payload.get("books")
-            normalised_books = _normalise_books(shelf_books)
-            if normalised_books is not None:
-                payload["books"] = normalised_books
-            else:
-                payload.pop("books", None)
+            _apply_shelf_books(payload, books)
 
         elif entity_type == "chapter":
             chapter_book = book_id if book_id is not None else payload.get("book_id")
             if chapter_book is not None:
                 payload["book_id"] = _validate_positive_int(chapter_book, "'book_id'")
-            chapter_priority = priority if priority is not None else payload.get("priority")
-            if chapter_priority is not None:
-                payload["priority"] = _optional_non_negative_int(chapter_priority, "'priority'")
+            _apply_priority(payload, priority)
 
         elif entity_type == "page":
             raw_page_book = book_id if book_id is not None else payload.get("book_id")
@@ -483,40 +508,17 @@ def _build_content_operation(
                 payload["book_id"] = _validate_positive_int(page_book, "'book_id'")
             if page_chapter is not None:
                 payload["chapter_id"] = _validate_positive_int(page_chapter, "'chapter_id'")
-            
-            markdown_value = payload.get("markdown")
-            html_value = payload.get("html")
-
-            if markdown is not None:
-                markdown_value = markdown
-            elif content is not None and markdown_value is None:
-                markdown_value = content
-            if html is not None:
-                html_value = html
-
-            if isinstance(markdown_value, str):
-                markdown_value = _validated_markdown(_normalise_str(markdown_value))
-            if isinstance(html_value, str):
-                html_value = _validated_html(_normalise_str(html_value))
-
-            if markdown_value and html_value:
-                raise _tool_error(
-                    "Provide either markdown/content or html, not both",
-                    hint="Supply only one of 'markdown'/'content' or 'html' for a page update.",
-                    context={"operation": operation, "entity_type": entity_type, "entity_id": entity_id},
-                )
-            if markdown_value is not None:
-                payload["markdown"] = markdown_value
-            elif "markdown" in payload:
-                payload.pop("markdown")
-            if html_value is not None:
-                payload["html"] = html_value
-            elif "html" in payload:
-                payload.pop("html")
-
-            page_priority = priority if priority is not None else payload.get("priority")
-            if page_priority is not None:
-                payload["priority"] = _optional_non_negative_int(page_priority, "'priority'")
+
+            _apply_page_body(
+                payload,
+                markdown=markdown,
+                html=html,
+                content=content,
+                hint="Supply only one of 'markdown'/'content' or 'html' for a page update.",
+                context={"operation": operation, "entity_type": entity_type, "entity_id": entity_id},
+            )
+
+            _apply_priority(payload, priority)
 
         else:  # pragma: no cover - exhaustive guard
             raise _tool_error(
@@ -541,6 +543,48 @@ def _build_content_operation(
     )
 
 
+def _make_result(
+    operation: str,
+    entity_type: str,
+    response: Any,
+    fallback_id: Optional[int],
+) -> Dict[str, Any]:
+    result: Dict[str, Any] = {
+        "operation": operation,
+        "entity_type": entity_type,
+        "success": True,
+        "data": response,
+    }
+    if fallback_id is not None:
+        result["id"] = fallback_id
+    elif isinstance(response, dict) and isinstance(response.get("id"), int):
+        result["id"] = response["id"]
+    return result
+
+
+def _run_concurrently(
+    fn: Callable[[Any], Any],
+    args: Sequence[Any],
+    *,
+    max_workers: int,
+) -> list[Tuple[Any, Optional[BaseException]]]:
+    """Call ``fn`` on each argument using a bounded thread pool.
+
+    Returns one ``(result, error)`` pair per argument, in input order, so batch
+    tools can report outcomes as if the calls had run sequentially.
+    """
+
+    if not args:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(args)))) as pool:
+        futures = [pool.submit(fn, arg) for arg in args]
+    outcomes: list[Tuple[Any, Optional[BaseException]]] = []
+    for future in futures:
+        error = future.exception()
+        outcomes.append((None, error) if error is not None else (future.result(), None))
+    return outcomes
+
+
 def _as_string(value: Any) -> Optional[str]:
     if isinstance(value, str):
         return value
@@ -550,8 +594,8 @@ def _as_string(value: Any) -> Optional[str]:
 
 
 def _trim_summary(raw: str) -> str:
-    without_tags = _HTML_TAG_RE.sub("", raw).replace("\n", " ").strip()
-    collapsed = re.sub(r"\s+", " ", without_tags)
+    without_tags = _HTML_TAG_RE.sub("", raw) if "<" in raw else raw
+    collapsed = _WHITESPACE_RE.sub(" ", without_tags).strip()
     return f"{collapsed[:277]}..." if len(collapsed) > 280 else collapsed
 
 
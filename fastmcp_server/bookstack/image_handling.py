@@ -8,18 +8,29 @@ import hashlib
 import ipaddress
 import json
 import mimetypes
-import re
 import socket
-import tempfile
-from typing import Any, Dict, Optional, Sequence, Tuple
-from urllib.parse import unquote, urljoin, urlparse
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+from urllib.parse import ParseResult, unquote, urljoin, urlparse
 
 import requests
 
+try:  # orjson serialises nested form fields (tags, books) straight to UTF-8
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+try:  # pybase64 decodes with SIMD kernels; large cover images are its main use
+    import pybase64
+except ImportError:  # pragma: no cover - optional accelerator
+    pybase64 = None
+
 from .api_client import (
     ToolError,
     _bookstack_base_url,
     _bookstack_request,
+    _get_fetch_session,
     _tool_error,
     logger,
 )
@@ -29,12 +40,16 @@ from .schemas import (
     PreparedImage,
     _ALLOWED_MIME_TYPES,
     _ALLOWED_URL_SCHEMES,
+    _ASCII_WHITESPACE,
     _DATA_URL_RE,
     _DEFAULT_MIME_TYPE,
-    _FALLBACK_FILE_NAME,
+    _DOWNLOAD_CHUNK_SIZE,
     _MAX_IMAGE_SIZE_BYTES,
     _MAX_URL_REDIRECTS,
     _REQUEST_TIMEOUT_SECONDS,
+    _UNSAFE_FILENAME_CHARS_RE,
+    _URL_MEMO_MAX_LENGTH,
+    _WHITESPACE_RE,
 )
 
 
@@ -79,10 +94,32 @@ def _normalise_str(value: Optional[str]) -> Optional[str]:
 # URL/base64 utilities
 # ============================================================================
 
+@lru_cache(maxsize=256)
+def _parse_url_cached(url: str) -> ParseResult:
+    return urlparse(url)
+
+
+def _parse_url(url: str) -> ParseResult:
+    """urlparse memoised for URLs that are re-posted or re-fetched.
+
+    Only URL-sized strings are cached so arbitrary user input is never pinned.
+    """
+    if len(url) <= _URL_MEMO_MAX_LENGTH:
+        return _parse_url_cached(url)
+    return urlparse(url)
+
+
+_URL_PREFIXES = tuple(f"{scheme}://" for scheme in sorted(_ALLOWED_URL_SCHEMES))
+
+
 def _is_url(value: str) -> bool:
     """Check if a string is a valid HTTP/HTTPS URL."""
+    candidate = value.strip()
+    # Cheap rejection before urlparse; schemes are case-insensitive
+    if not candidate[:8].lower().startswith(_URL_PREFIXES):
+        return False
     try:
-        parsed = urlparse(value.strip())
+        parsed = urlparse(candidate)
         return parsed.scheme.lower() in _ALLOWED_URL_SCHEMES and bool(parsed.netloc)
     except Exception as exc:
         logger.debug("_is_url: failed to parse %r: %s", value[:200], exc)
@@ -92,23 +129,42 @@ def _is_url(value: str) -> bool:
 def _extract_filename_from_url(url: str, fallback: str) -> str:
     """Extract a sensible filename from a URL."""
     try:
-        parsed = urlparse(url)
-        path = parsed.path.strip("/")
-        if path and "." in path:
-            filename = path.split("/")[-1]
-            # Sanitize filename - remove special characters
-            filename = re.sub(r'[^\w\-_\.]', '_', filename)
-            if filename and len(filename) <= 255:
-                return filename
+        return _filename_from_parsed(urlparse(url), fallback)
     except Exception as exc:
         logger.debug("_extract_filename_from_url: failed for %r: %s", url[:200], exc)
     return fallback
 
 
+def _filename_from_parsed(parsed: ParseResult, fallback: str) -> str:
+    """Extract a sensible filename from an already parsed URL."""
+    path = parsed.path.strip("/")
+    if path and "." in path:
+        filename = path.split("/")[-1]
+        # Sanitize filename - remove special characters
+        filename = _UNSAFE_FILENAME_CHARS_RE.sub("_", filename)
+        if filename and len(filename) <= 255:
+            return filename
+    return fallback
+
+
+_B64DECODE = pybase64.b64decode if pybase64 is not None else base64.b64decode
+
+
+def _strip_whitespace(payload: str) -> str:
+    """Remove whitespace, skipping the regex pass when there is none.
+
+    Encoded images rarely contain line breaks, and a few substring scans
+    are much cheaper than running the regex over megabytes of base64.
+    """
+    if payload.isascii() and not any(char in payload for char in _ASCII_WHITESPACE):
+        return payload
+    return _WHITESPACE_RE.sub("", payload)
+
+
 def _decode_base64_string(payload: str) -> bytes:
     try:
-        cleaned = re.sub(r"\s+", "", payload)
-        return base64.b64decode(cleaned, validate=True)
+        cleaned = _strip_whitespace(payload)
+        return _B64DECODE(cleaned, validate=True)
     except (ValueError, binascii.Error) as exc:
         raise _tool_error(
             "Failed to decode base64 image data",
@@ -145,9 +201,10 @@ def _classify_disallowed_ip(ip_text: str) -> Optional[str]:
     return None
 
 
-def _resolve_url_targets(url: str) -> Sequence[str]:
+def _resolve_url_targets(url: str, *, parsed: Optional[ParseResult] = None) -> Sequence[str]:
     """Resolve a URL hostname to concrete IP addresses."""
-    parsed = urlparse(url)
+    if parsed is None:
+        parsed = urlparse(url)
     hostname = parsed.hostname
     if not hostname:
         raise _tool_error(
@@ -185,10 +242,10 @@ def _resolve_url_targets(url: str) -> Sequence[str]:
     return resolved_ips
 
 
-def _validate_remote_image_target(url: str) -> None:
+def _validate_remote_image_target(url: str, *, parsed: Optional[ParseResult] = None) -> None:
     """Reject URLs that resolve to internal or otherwise unsafe IP ranges."""
     blocked_targets = []
-    for ip_text in _resolve_url_targets(url):
+    for ip_text in _resolve_url_targets(url, parsed=parsed):
         reason = _classify_disallowed_ip(ip_text)
         if reason:
             blocked_targets.append({"ip": ip_text, "reason": reason})
@@ -220,10 +277,12 @@ def _fetch_image_from_url(url: str, fallback_name: str) -> PreparedImage:
 
     try:
         for redirect_count in range(_MAX_URL_REDIRECTS + 1):
-            _validate_remote_image_target(current_url)
+            # Parsed once per hop; reused for the final filename as well
+            parsed_url = _parse_url(current_url)
+            _validate_remote_image_target(current_url, parsed=parsed_url)
 
             # Redirects are validated hop-by-hop so internal targets cannot be reached.
-            response = requests.get(
+            response = _get_fetch_session().get(
                 current_url,
                 timeout=_REQUEST_TIMEOUT_SECONDS,
                 stream=True,
@@ -267,25 +326,18 @@ def _fetch_image_from_url(url: str, fallback_name: str) -> PreparedImage:
                 context={"url": url, "size": content_length}
             )
 
-        # Download with size limit using SpooledTemporaryFile for large images
-        spool = tempfile.SpooledTemporaryFile(max_size=5*1024*1024)  # 5MB spill threshold
-        try:
-            total_size = 0
-            for chunk in response.iter_content(chunk_size=8192):
-                spool.write(chunk)
-                total_size += len(chunk)
-                if total_size > _MAX_IMAGE_SIZE_BYTES:
-                    raise _tool_error(
-                        f"Image download exceeded {_MAX_IMAGE_SIZE_BYTES} byte limit",
-                        hint="Use a smaller image or increase the size limit.",
-                        context={"url": url}
-                    )
-            
-            # Read the final content
-            spool.seek(0)
-            content = spool.read()
-        finally:
-            spool.close()
+        # Download with size limit; the result is held in memory anyway, so
+        # grow one bytearray in large chunks rather than spooling to disk
+        buffer = bytearray()
+        for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+            if len(buffer) + len(chunk) > _MAX_IMAGE_SIZE_BYTES:
+                raise _tool_error(
+                    f"Image download exceeded {_MAX_IMAGE_SIZE_BYTES} byte limit",
+                    hint="Use a smaller image or increase the size limit.",
+                    context={"url": url}
+                )
+            buffer += chunk
+        content = bytes(buffer)
 
         if not content:
             raise _tool_error(
@@ -323,7 +375,7 @@ def _fetch_image_from_url(url: str, fallback_name: str) -> PreparedImage:
             )
 
         # Extract filename
-        filename = _extract_filename_from_url(current_url, fallback_name)
+        filename = _filename_from_parsed(parsed_url, fallback_name)
 
         return PreparedImage(
             filename=filename,
@@ -382,32 +434,32 @@ def _prepare_image_payload(
 
     value = image.strip()
 
-    # Check if it looks like a URL (has scheme and netloc)
-    try:
-        parsed = urlparse(value)
-        if parsed.scheme and parsed.netloc:
-            # It looks like a URL - check if it's allowed
-            if parsed.scheme.lower() not in _ALLOWED_URL_SCHEMES:
-                raise _tool_error(
-                    f"URL scheme '{parsed.scheme}' is not supported",
-                    hint="Only HTTP and HTTPS URLs are allowed for image fetching.",
-                    context={"url": value, "scheme": parsed.scheme}
-                )
-            # It's a valid HTTP/HTTPS URL
-            return _fetch_image_from_url(value, fallback_name)
-    except ToolError:
-        # Re-raise ToolErrors
-        raise
-    except Exception:
-        # Not a valid URL, continue to other formats
-        pass
+    # HTTP/HTTPS URL; the uncached prefix check keeps payloads away from _is_url
+    if value[:8].lower().startswith(_URL_PREFIXES) and _is_url(value):
+        return _fetch_image_from_url(value, fallback_name)
+
+    # Any other "scheme://host" value is a URL we refuse rather than base64.
+    # Only this shape can have a netloc, so base64 and data URLs never reach
+    # urlparse (which copies the whole string while sanitising it).
+    colon = value.find(":")
+    if colon > 0 and value.startswith("//", colon + 1):
+        try:
+            parsed: Optional[ParseResult] = _parse_url(value)
+        except ValueError:
+            parsed = None
+        if parsed is not None and parsed.scheme and parsed.netloc:
+            raise _tool_error(
+                f"URL scheme '{parsed.scheme}' is not supported",
+                hint="Only HTTP and HTTPS URLs are allowed for image fetching.",
+                context={"url": value, "scheme": parsed.scheme}
+            )
 
     # Check if it's a data URL
     match = _DATA_URL_RE.match(value)
     if match:
         mime_type = match.group(1) or fallback_type
         is_base64 = bool(match.group(2))
-        raw_payload = match.group(3) or ""
+        raw_payload = value[match.end():]
         if is_base64:
             content = _decode_base64_string(raw_payload)
         else:
@@ -473,16 +525,42 @@ def _prepare_cover_image_from_gallery(
     return resolve_fetch(image_url, effective_name)
 
 
+_FORM_SKIP_KEYS = frozenset({"image_id", "cover_image"})
+
+
+def _form_json(value: Any) -> str:
+    """Serialise a nested form field as JSON text."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+def _form_field_text(value: Any) -> str:
+    """Fallback conversion for subclasses and other uncommon value types."""
+    if isinstance(value, (dict, list)):
+        return _form_json(value)
+    return value if isinstance(value, str) else str(value)
+
+
+# Exact-type dispatch for the JSON value types; anything else (including str
+# subclasses such as enums) goes through _form_field_text.
+_FORM_FIELD_CASTS = {
+    str: lambda value: value,
+    int: str,
+    float: str,
+    bool: str,
+    dict: _form_json,
+    list: _form_json,
+}
+
+
 def _prepare_form_data(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Convert a JSON-style payload into form fields for multipart requests."""
     form_data: Dict[str, Any] = {}
     for key, value in payload.items():
-        if value is None or key in {"image_id", "cover_image"}:
+        if value is None or key in _FORM_SKIP_KEYS:
             continue
-        if isinstance(value, (dict, list)):
-            form_data[key] = json.dumps(value)
-        else:
-            form_data[key] = value if isinstance(value, str) else str(value)
+        form_data[key] = _FORM_FIELD_CASTS.get(type(value), _form_field_text)(value)
     return form_data
 
 
@@ -518,7 +596,12 @@ def _normalize_image_list_response(
     return api_response, None
 
 
-def _build_list_cache_key(params: Dict[str, Any]) -> str:
+def _build_list_cache_key(params: Dict[str, Any]) -> Hashable:
+    """Return a cache key for image list parameters.
+
+    The key is the normalised parameter tuple itself, which the cache hashes
+    directly; a digest of its JSON form is used only if a value is unhashable.
+    """
     items: list[Tuple[str, Any]] = []
     for key, value in sorted(params.items()):
         if isinstance(value, list):
@@ -527,11 +610,16 @@ def _build_list_cache_key(params: Dict[str, Any]) -> str:
             items.append((key, tuple(sorted(value.items()))))
         else:
             items.append((key, value))
-    encoded = json.dumps(items, sort_keys=True, default=str)
-    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    key_tuple = ("image_list", tuple(items))
+    try:
+        hash(key_tuple)
+    except TypeError:
+        encoded = json.dumps(items, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    return key_tuple
 
 
-def _get_cached_list(cache_key: str) -> Optional[CacheEntry]:
+def _get_cached_list(cache_key: Hashable) -> Optional[CacheEntry]:
     cached = bookstack_cache.images.get(cache_key)
     if cached is None:
         return None
@@ -540,7 +628,7 @@ def _get_cached_list(cache_key: str) -> Optional[CacheEntry]:
     return CacheEntry(data=cached)
 
 
-def _set_cached_list(cache_key: str, data: Any, metadata: Optional[Dict[str, Any]]) -> None:
+def _set_cached_list(cache_key: Hashable, data: Any, metadata: Optional[Dict[str, Any]]) -> None:
     from .api_client import _cache_ttl_for
     bookstack_cache.images.set(cache_key, {"data": data, "metadata": metadata}, ttl=_cache_ttl_for("/api/image-gallery"))
 
@@ -549,12 +637,16 @@ def _invalidate_list_cache() -> None:
     bookstack_cache.images.invalidate()
 
 
+@lru_cache(maxsize=512)
+def _parse_iso8601(value: str) -> datetime:
+    """Parse an ISO 8601 string; memoised since filters repeat across calls."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
 def _ensure_iso8601(value: str, label: str):
     """Validate ISO 8601 datetime strings."""
-    from datetime import datetime
     try:
-        normalised = value.replace("Z", "+00:00")
-        return datetime.fromisoformat(normalised)
+        return _parse_iso8601(value)
     except ValueError as exc:
         raise _tool_error(
             f"{label} must be an ISO-8601 datetime string",
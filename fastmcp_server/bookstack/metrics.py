@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import itertools
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from functools import wraps
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 import threading
 
 
+def _tail(buffer: Deque[Any], limit: int) -> List[Any]:
+    """Return the last ``limit`` items of a bounded deque as a list."""
+    return list(itertools.islice(buffer, max(0, len(buffer) - limit), None))
+
+
 @dataclass
 class RequestMetrics:
     """Metrics for a single request."""
@@ -35,7 +41,7 @@ class ToolMetrics:
     min_duration: float = float('inf')
     max_duration: float = 0.0
     last_called: Optional[float] = None
-    errors: List[str] = field(default_factory=list)
+    errors: Deque[str] = field(default_factory=lambda: deque(maxlen=100))
     
     def record_call(self, duration: float, success: bool, error: Optional[str] = None):
         """Record a tool call."""
@@ -51,9 +57,6 @@ class ToolMetrics:
             self.error_count += 1
             if error:
                 self.errors.append(error)
-                # Keep only last 100 errors
-                if len(self.errors) > 100:
-                    self.errors = self.errors[-100:]
     
     @property
     def avg_duration(self) -> float:
@@ -77,7 +80,7 @@ class ToolMetrics:
             "min_duration_ms": f"{self.min_duration * 1000:.2f}",
             "max_duration_ms": f"{self.max_duration * 1000:.2f}",
             "last_called": datetime.fromtimestamp(self.last_called).isoformat() if self.last_called else None,
-            "recent_errors": self.errors[-10:],  # Last 10 errors
+            "recent_errors": _tail(self.errors, 10),  # Last 10 errors
         }
 
 
@@ -86,11 +89,14 @@ class MetricsCollector:
     
     def __init__(self):
         import os
-        self._lock = threading.RLock()
-        self._start_time = time.time()
+        self._lock = threading.Lock()
+        self._start_time = time.monotonic()
         
-        # Request metrics
-        self._requests: List[RequestMetrics] = []
+        # Request metrics (bounded ring buffers; appends never copy)
+        self._requests: Deque[RequestMetrics] = deque(maxlen=10000)
+        # Running totals over the buffered requests, so summaries are O(1)
+        self._total_duration = 0.0
+        self._error_count = 0
         self._request_counts: Dict[str, int] = defaultdict(int)
         self._status_counts: Dict[int, int] = defaultdict(int)
         
@@ -101,10 +107,10 @@ class MetricsCollector:
         self._entity_operations: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
         
         # Error tracking
-        self._errors: List[Dict[str, Any]] = []
+        self._errors: Deque[Dict[str, Any]] = deque(maxlen=1000)
         
         # Performance tracking
-        self._slow_requests: List[RequestMetrics] = []
+        self._slow_requests: Deque[RequestMetrics] = deque(maxlen=100)
         self._slow_threshold = float(os.environ.get("BS_SLOW_REQUEST_THRESHOLD", "5.0"))  # seconds
     
     def record_request(
@@ -126,15 +132,20 @@ class MetricsCollector:
                 error=error,
             )
             
+            if len(self._requests) == self._requests.maxlen:
+                evicted = self._requests[0]
+                self._total_duration -= evicted.duration
+                if evicted.error:
+                    self._error_count -= 1
             self._requests.append(metrics)
+            self._total_duration += duration
+            if error:
+                self._error_count += 1
             self._request_counts[f"{method} {endpoint}"] += 1
             self._status_counts[status] += 1
             
             if duration > self._slow_threshold:
                 self._slow_requests.append(metrics)
-                # Keep only last 100 slow requests
-                if len(self._slow_requests) > 100:
-                    self._slow_requests = self._slow_requests[-100:]
             
             if error:
                 self._errors.append({
@@ -143,13 +154,6 @@ class MetricsCollector:
                     "endpoint": endpoint,
                     "error": error,
                 })
-                # Keep only last 1000 errors
-                if len(self._errors) > 1000:
-                    self._errors = self._errors[-1000:]
-            
-            # Keep only last 10000 requests
-            if len(self._requests) > 10000:
-                self._requests = self._requests[-10000:]
     
     def record_tool_call(
         self,
@@ -173,18 +177,17 @@ class MetricsCollector:
     def get_summary(self) -> Dict[str, Any]:
         """Get metrics summary."""
         with self._lock:
-            uptime = time.time() - self._start_time
+            uptime = time.monotonic() - self._start_time
             total_requests = len(self._requests)
             
             # Calculate request rate
             requests_per_second = total_requests / uptime if uptime > 0 else 0
             
             # Calculate average duration
-            total_duration = sum(r.duration for r in self._requests)
-            avg_duration = total_duration / total_requests if total_requests > 0 else 0
+            avg_duration = self._total_duration / total_requests if total_requests > 0 else 0
             
             # Calculate error rate
-            error_count = sum(1 for r in self._requests if r.error)
+            error_count = self._error_count
             error_rate = (error_count / total_requests * 100) if total_requests > 0 else 0
             
             return {
@@ -218,7 +221,7 @@ class MetricsCollector:
     def get_recent_errors(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent errors."""
         with self._lock:
-            return self._errors[-limit:]
+            return _tail(self._errors, limit)
     
     def get_slow_requests(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get slow requests."""
@@ -231,7 +234,7 @@ class MetricsCollector:
                     "duration_ms": f"{r.duration * 1000:.2f}",
                     "status": r.status,
                 }
-                for r in self._slow_requests[-limit:]
+                for r in _tail(self._slow_requests, limit)
             ]
     
     def get_top_endpoints(self, limit: int = 10) -> List[Dict[str, Any]]:
@@ -252,13 +255,15 @@ class MetricsCollector:
         """Reset all metrics."""
         with self._lock:
             self._requests.clear()
+            self._total_duration = 0.0
+            self._error_count = 0
             self._request_counts.clear()
             self._status_counts.clear()
             self._tool_metrics.clear()
             self._entity_operations.clear()
             self._errors.clear()
             self._slow_requests.clear()
-            self._start_time = time.time()
+            self._start_time = time.monotonic()
 
 
 # Global metrics collector
@@ -275,7 +280,7 @@ def track_request(method: str, endpoint: str):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             error = None
             status = 200
             
@@ -287,7 +292,7 @@ def track_request(method: str, endpoint: str):
                 status = 500
                 raise
             finally:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 _metrics_collector.record_request(method, endpoint, duration, status, error)
         
         return wrapper
@@ -299,7 +304,7 @@ def track_tool(tool_name: str):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             error = None
             success = True
             
@@ -311,7 +316,7 @@ def track_tool(tool_name: str):
                 success = False
                 raise
             finally:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 _metrics_collector.record_tool_call(tool_name, duration, success, error)
         
         return wrapper
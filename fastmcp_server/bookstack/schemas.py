@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import copy
+import json
 import os
 import re
 from dataclasses import dataclass
-from typing import Annotated, Any, Dict, Literal, Optional, Sequence, Tuple, Union
+from typing import Annotated, Any, Dict, Literal, Optional
 
-from pydantic import Field
 from pydantic.json_schema import WithJsonSchema
 from typing_extensions import TypedDict
 
@@ -18,6 +17,16 @@ OperationType = Literal["create", "read", "update", "delete"]
 BatchOperationType = Literal["bulk_create", "bulk_update", "bulk_delete"]
 
 
+def _schema_copy(schema: Any) -> Any:
+    """Return an independent copy of a JSON schema fragment.
+
+    The fragments below share nested dicts by reference, since they are never
+    mutated in this module; each schema handed to pydantic gets its own tree.
+    A JSON round-trip is roughly twice as fast as a deepcopy here.
+    """
+    return json.loads(json.dumps(schema))
+
+
 class TagDict(TypedDict):
     """Tag representation expected by the BookStack API."""
 
@@ -58,7 +67,7 @@ _TAG_LIST_SCHEMA: Dict[str, Any] = {
     "title": "Tags",
     "description": "Tags to assign to the entity.",
     "type": "array",
-    "items": copy.deepcopy(_TAG_SCHEMA),
+    "items": _TAG_SCHEMA,
 }
 
 _BOOK_ASSOCIATIONS_SCHEMA: Dict[str, Any] = {
@@ -82,8 +91,8 @@ _JSON_STRING_PAYLOAD_SCHEMA: Dict[str, Any] = {
 }
 
 
-TagListInput = Annotated[list[TagDict], WithJsonSchema(copy.deepcopy(_TAG_LIST_SCHEMA))]
-BooksAssociationList = Annotated[list[int], WithJsonSchema(copy.deepcopy(_BOOK_ASSOCIATIONS_SCHEMA))]
+TagListInput = Annotated[list[TagDict], WithJsonSchema(_schema_copy(_TAG_LIST_SCHEMA))]
+BooksAssociationList = Annotated[list[int], WithJsonSchema(_schema_copy(_BOOK_ASSOCIATIONS_SCHEMA))]
 
 # Helper schemas for optional integers (MCP strict mode requires oneOf instead of type: ["integer", "null"])
 _OPTIONAL_INT_SCHEMA: Dict[str, Any] = {
@@ -119,7 +128,7 @@ _BOOK_PAYLOAD_SCHEMA: Dict[str, Any] = {
         "tags": {
             "type": "array",
             "description": "Tags to assign to the entity.",
-            "items": copy.deepcopy(_TAG_SCHEMA),
+            "items": _TAG_SCHEMA,
         },
         "image_id": {"type": "integer", "minimum": 1, "description": "Existing gallery image ID to reuse as the cover."},
         "cover_image": {"type": "string", "description": "Cover image payload (base64, data URL, or HTTP/HTTPS URL)."},
@@ -143,7 +152,7 @@ _BOOKSHELF_PAYLOAD_SCHEMA: Dict[str, Any] = {
         "tags": {
             "type": "array",
             "description": "Tags to assign to the entity.",
-            "items": copy.deepcopy(_TAG_SCHEMA),
+            "items": _TAG_SCHEMA,
         },
     },
 }
@@ -162,7 +171,7 @@ _CHAPTER_PAYLOAD_SCHEMA: Dict[str, Any] = {
         "tags": {
             "type": "array",
             "description": "Tags to assign to the entity.",
-            "items": copy.deepcopy(_TAG_SCHEMA),
+            "items": _TAG_SCHEMA,
         },
     },
 }
@@ -184,24 +193,24 @@ _PAGE_PAYLOAD_SCHEMA: Dict[str, Any] = {
         "tags": {
             "type": "array",
             "description": "Tags to assign to the entity.",
-            "items": copy.deepcopy(_TAG_SCHEMA),
+            "items": _TAG_SCHEMA,
         },
     },
 }
 
 _PAYLOAD_ONE_OF_WITH_STRING_AND_NULL: list[Dict[str, Any]] = [
-    copy.deepcopy(_BOOK_PAYLOAD_SCHEMA),
-    copy.deepcopy(_BOOKSHELF_PAYLOAD_SCHEMA),
-    copy.deepcopy(_CHAPTER_PAYLOAD_SCHEMA),
-    copy.deepcopy(_PAGE_PAYLOAD_SCHEMA),
+    _BOOK_PAYLOAD_SCHEMA,
+    _BOOKSHELF_PAYLOAD_SCHEMA,
+    _CHAPTER_PAYLOAD_SCHEMA,
+    _PAGE_PAYLOAD_SCHEMA,
     # Removed _RAW_OBJECT_PAYLOAD_SCHEMA to comply with MCP strict schema validation
     # Users can still pass custom fields via JSON string in _JSON_STRING_PAYLOAD_SCHEMA
-    copy.deepcopy(_JSON_STRING_PAYLOAD_SCHEMA),
+    _JSON_STRING_PAYLOAD_SCHEMA,
     {"type": "null"},
 ]
 
 PayloadOverrides = Annotated[Any, WithJsonSchema({
-    "oneOf": copy.deepcopy(_PAYLOAD_ONE_OF_WITH_STRING_AND_NULL),
+    "oneOf": _schema_copy(_PAYLOAD_ONE_OF_WITH_STRING_AND_NULL),
 })]
 
 BATCH_ITEM_SCHEMA: Dict[str, Any] = {
@@ -215,7 +224,7 @@ BATCH_ITEM_SCHEMA: Dict[str, Any] = {
         "data": {
             "title": "Item payload",
             "description": "Fields applied to the entity. Provide structured values or a JSON string.",
-            "oneOf": copy.deepcopy(_PAYLOAD_ONE_OF_WITH_STRING_AND_NULL),
+            "oneOf": _PAYLOAD_ONE_OF_WITH_STRING_AND_NULL,
         },
     },
 }
@@ -225,11 +234,11 @@ BATCH_ITEMS_LIST_SCHEMA: Dict[str, Any] = {
     "description": "List of items to process.",
     "type": "array",
     "minItems": 1,
-    "items": copy.deepcopy(BATCH_ITEM_SCHEMA),
+    "items": BATCH_ITEM_SCHEMA,
 }
 
-BatchItemInput = Annotated[Dict[str, Any], WithJsonSchema(copy.deepcopy(BATCH_ITEM_SCHEMA))]
-BatchItemsListInput = Annotated[list[Dict[str, Any]], WithJsonSchema(copy.deepcopy(BATCH_ITEMS_LIST_SCHEMA))]
+BatchItemInput = Annotated[Dict[str, Any], WithJsonSchema(_schema_copy(BATCH_ITEM_SCHEMA))]
+BatchItemsListInput = Annotated[list[Dict[str, Any]], WithJsonSchema(_schema_copy(BATCH_ITEMS_LIST_SCHEMA))]
 
 
 @dataclass
@@ -273,8 +282,16 @@ _LIST_BASE_PATHS: Dict[ListEntityType, str] = {
     "pages": _ENTITY_BASE_PATHS["page"],
 }
 
-_DATA_URL_RE = re.compile(r"^data:([^;,]+)?(;base64)?,(.*)$", re.IGNORECASE)
-_HTML_TAG_RE = re.compile(r"<[^>]+>")
+# Matches only the data URL header; the payload is everything after match.end(),
+# so multi-megabyte images are sliced once instead of scanned by the regex.
+_DATA_URL_RE = re.compile(r"^data:([^;,]+)?(;base64)?,", re.IGNORECASE)
+# Excluding "<" from the body keeps stripping linear on text with stray "<"
+# characters that never close; otherwise each one rescans to the end.
+_HTML_TAG_RE = re.compile(r"<[^<>]+>")
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^\w\-_\.]")
+_WHITESPACE_RE = re.compile(r"\s+")
+# The ASCII characters matched by \s, for memchr-style membership checks
+_ASCII_WHITESPACE = "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f "
 
 _FALLBACK_FILE_NAME = "upload.bin"
 _DEFAULT_MIME_TYPE = "application/octet-stream"
@@ -283,7 +300,28 @@ _DEFAULT_MIME_TYPE = "application/octet-stream"
 _MAX_IMAGE_SIZE_BYTES = int(os.environ.get("BS_MAX_IMAGE_SIZE", str(50 * 1024 * 1024)))  # 50MB limit
 _REQUEST_TIMEOUT_SECONDS = int(os.environ.get("BS_FETCH_TIMEOUT", "30"))
 _MAX_URL_REDIRECTS = int(os.environ.get("BS_MAX_REDIRECTS", "3"))
+_URL_MEMO_MAX_LENGTH = 2048  # longer strings are parsed without memoisation
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
 _ALLOWED_URL_SCHEMES = {"http", "https"}
+
+# BookStack API connection pooling (size the pool for concurrent tool calls)
+_HTTP_POOL_CONNECTIONS = int(os.environ.get("BS_HTTP_POOL_CONNECTIONS", "10"))
+_HTTP_POOL_MAXSIZE = int(os.environ.get("BS_HTTP_POOL_MAXSIZE", "20"))
+
+# Concurrent requests per batch tool call (opt-in; 1 keeps items strictly in
+# order). Keep at or below the pool size. Creates always run in order.
+_BATCH_MAX_WORKERS = int(os.environ.get("BS_BATCH_MAX_WORKERS", "1"))
+
+# Background threads warming the next list page into the GET cache; 0 disables
+_LIST_PREFETCH_WORKERS = int(os.environ.get("BS_LIST_PREFETCH_WORKERS", "0"))
+
+# Retries for idempotent BookStack calls; backoff is base * 2**n plus jitter
+_HTTP_RETRIES = int(os.environ.get("BS_HTTP_RETRIES", "3"))
+_HTTP_BACKOFF_FACTOR = float(os.environ.get("BS_HTTP_BACKOFF_FACTOR", "0.5"))
+
+# Fail fast after consecutive transport failures until the cooldown elapses
+_CIRCUIT_FAIL_MAX = int(os.environ.get("BS_CIRCUIT_FAIL_MAX", "5"))
+_CIRCUIT_RESET_TIMEOUT_SECONDS = float(os.environ.get("BS_CIRCUIT_RESET_TIMEOUT", "30"))
 _ALLOWED_MIME_TYPES = {
     "image/jpeg",
     "image/jpg",
@@ -309,3 +347,4 @@ _CONTENT_KNOWN_FIELDS = (
     "cover_image",
     "priority",
 )
+_CONTENT_KNOWN_FIELDS_SET = frozenset(_CONTENT_KNOWN_FIELDS)
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 # Module-level imports needed for monkeypatching compatibility
-import copy
 import json
 import os
 import re
-import requests  # CRITICAL: tests monkeypatch fastmcp_server.bookstack.tools.requests.post
+import requests
 import socket    # CRITICAL: tests monkeypatch tools.socket.getaddrinfo
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from typing import Annotated, Any, Dict, Literal, Optional, Sequence, Tuple
 
 from fastmcp import FastMCP
@@ -36,11 +38,12 @@ from .schemas import (
     _MAX_IMAGE_SIZE_BYTES, _REQUEST_TIMEOUT_SECONDS, _MAX_URL_REDIRECTS,
     _ALLOWED_URL_SCHEMES, _ALLOWED_MIME_TYPES,
     _CONTENT_KNOWN_FIELDS,
+    _LIST_PREFETCH_WORKERS, _BATCH_MAX_WORKERS,
 )
 
 from .api_client import (
     JSONFormatter, logger, ToolError,
-    _require_env,
+    _require_env, _get_session, _get_fetch_session,
     _bookstack_base_url as _api_bookstack_base_url,
     _bookstack_headers as _api_bookstack_headers,
     _tool_error, _ensure,
@@ -70,7 +73,7 @@ from .content_operations import (
     _validate_positive_int, _optional_positive_int, _optional_non_negative_int,
     _normalise_books, _format_tags,
     _compact_payload, _extract_known_fields,
-    _build_content_operation,
+    _build_content_operation, _make_result, _run_concurrently,
     _filter_collection, _normalise_filters,
     _as_string, _trim_summary, _extract_summary,
     _coerce_int, _coerce_float,
@@ -121,6 +124,55 @@ def _prepare_cover_image_from_gallery(image_id, *, fallback_name=None):
     )
 
 
+def _image_list_request(
+    params: Dict[str, Any], *, offset: int, count: int
+) -> Tuple[Any, Dict[str, Any]]:
+    """Fetch and normalise an image-gallery listing through the list cache.
+
+    The returned metadata is a fresh dict flagged ``cached`` on a hit.
+    """
+
+    cache_key = _build_list_cache_key(params)
+    cached_entry = _get_cached_list(cache_key)
+    if cached_entry is not None:
+        cached_metadata = dict(cached_entry.metadata or {})
+        cached_metadata["cached"] = True
+        return cached_entry.data, cached_metadata
+
+    _mod = _sys.modules[__name__]
+    response = _mod._bookstack_request("GET", "/api/image-gallery", params=params)
+    data, metadata = _normalize_image_list_response(response, offset=offset, count=count)
+    _set_cached_list(cache_key, data, metadata)
+    return data, dict(metadata) if metadata else {}
+
+
+_prefetch_pool: Optional[ThreadPoolExecutor] = None
+_prefetch_pool_lock = threading.Lock()
+
+
+def _prefetch_list_page(base_path: str, params: Dict[str, Any]) -> None:
+    """Warm the GET cache with the page after ``params`` in the background."""
+
+    global _prefetch_pool
+    if _prefetch_pool is None:
+        with _prefetch_pool_lock:
+            if _prefetch_pool is None:
+                _prefetch_pool = ThreadPoolExecutor(
+                    max_workers=_LIST_PREFETCH_WORKERS,
+                    thread_name_prefix="bookstack-prefetch",
+                )
+    next_params = {**params, "offset": params["offset"] + params["count"]}
+    _mod = _sys.modules[__name__]
+
+    def _fetch() -> None:
+        try:
+            _mod._bookstack_request("GET", base_path, params=next_params)
+        except Exception:
+            logger.debug("bookstack.list_prefetch_failed", exc_info=True)
+
+    _prefetch_pool.submit(_fetch)
+
+
 def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -> None:
     """Register BookStack tools on the provided FastMCP instance.
     
@@ -148,31 +200,31 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
             ],
             id: Annotated[
                 Optional[int],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_INT_SCHEMA), "description": "Entity ID (required for read, update, delete)."}),
+                WithJsonSchema({**_OPTIONAL_INT_SCHEMA, "description": "Entity ID (required for read, update, delete)."}),
             ] = None,
             name: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_SCHEMA), "description": "Entity name/title."}),
+                WithJsonSchema({**_OPTIONAL_STRING_SCHEMA, "description": "Entity name/title."}),
             ] = None,
             description: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_SCHEMA), "description": "Entity description."}),
+                WithJsonSchema({**_OPTIONAL_STRING_SCHEMA, "description": "Entity description."}),
             ] = None,
             content: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_NO_MIN_SCHEMA), "description": "Page content (alias for markdown)."}),
+                WithJsonSchema({**_OPTIONAL_STRING_NO_MIN_SCHEMA, "description": "Page content (alias for markdown)."}),
             ] = None,
             markdown: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_NO_MIN_SCHEMA), "description": "Markdown content."}),
+                WithJsonSchema({**_OPTIONAL_STRING_NO_MIN_SCHEMA, "description": "Markdown content."}),
             ] = None,
             html: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_NO_MIN_SCHEMA), "description": "HTML content."}),
+                WithJsonSchema({**_OPTIONAL_STRING_NO_MIN_SCHEMA, "description": "HTML content."}),
             ] = None,
             cover_image: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_NO_MIN_SCHEMA), "description": "Cover image payload (base64, data URL, or HTTP/HTTPS URL)."}),
+                WithJsonSchema({**_OPTIONAL_STRING_NO_MIN_SCHEMA, "description": "Cover image payload (base64, data URL, or HTTP/HTTPS URL)."}),
             ] = None,
             updates: Annotated[
                 PayloadOverrides,
@@ -180,11 +232,11 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
             ] = None,
             book_id: Annotated[
                 Optional[int],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_INT_SCHEMA), "description": "Book ID context (required for chapter create, optional otherwise)."}),
+                WithJsonSchema({**_OPTIONAL_INT_SCHEMA, "description": "Book ID context (required for chapter create, optional otherwise)."}),
             ] = None,
             chapter_id: Annotated[
                 Optional[int],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_INT_SCHEMA), "description": "Chapter ID context (required for page create when no book_id)."}),
+                WithJsonSchema({**_OPTIONAL_INT_SCHEMA, "description": "Chapter ID context (required for page create when no book_id)."}),
             ] = None,
             books: Annotated[
                 Optional[BooksAssociationList],
@@ -202,7 +254,7 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
             ] = None,
             image_id: Annotated[
                 Optional[int],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_INT_SCHEMA), "description": "Image ID to use as cover (books only)."}),
+                WithJsonSchema({**_OPTIONAL_INT_SCHEMA, "description": "Image ID to use as cover (books only)."}),
             ] = None,
             priority: Annotated[
                 Optional[int],
@@ -269,39 +321,15 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
                     data=form_data or None,
                     files=files,
                 )
-                result: Dict[str, Any] = {
-                    "operation": operation,
-                    "entity_type": entity_type,
-                    "success": True,
-                    "data": response,
-                }
-                if id is not None:
-                    result["id"] = id
-                elif isinstance(response, dict) and isinstance(response.get("id"), int):
-                    result["id"] = response["id"]
-                if operation in {"create", "update", "delete"}:
-                    result_id = result.get("id")
-                    _invalidate_entity_cache(entity_type, result_id if isinstance(result_id, int) else None)
-                    collector.record_entity_operation(entity_type, operation)
-                return result
-
-            response = _bookstack_request(
-                prepared.method,
-                prepared.path,
-                params=prepared.params,
-                json=prepared.json,
-            )
+            else:
+                response = _bookstack_request(
+                    prepared.method,
+                    prepared.path,
+                    params=prepared.params,
+                    json=prepared.json,
+                )
 
-            result: Dict[str, Any] = {
-                "operation": operation,
-                "entity_type": entity_type,
-                "success": True,
-                "data": response,
-            }
-            if id is not None:
-                result["id"] = id
-            elif isinstance(response, dict) and isinstance(response.get("id"), int):
-                result["id"] = response["id"]
+            result = _make_result(operation, entity_type, response, id)
             if operation in {"create", "update", "delete"}:
                 result_id = result.get("id")
                 _invalidate_entity_cache(entity_type, result_id if isinstance(result_id, int) else None)
@@ -331,7 +359,7 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
             ] = 50,
             sort: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_NO_MIN_SCHEMA), "description": "Sort expression understood by BookStack (e.g. '-created_at')."}),
+                WithJsonSchema({**_OPTIONAL_STRING_NO_MIN_SCHEMA, "description": "Sort expression understood by BookStack (e.g. '-created_at')."}),
             ] = None,
             filters: Annotated[
                 Optional[Dict[str, str]],
@@ -339,11 +367,11 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
             ] = None,
             book_id: Annotated[
                 Optional[int],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_INT_SCHEMA), "description": "Limit chapters/pages to a specific book."}),
+                WithJsonSchema({**_OPTIONAL_INT_SCHEMA, "description": "Limit chapters/pages to a specific book."}),
             ] = None,
             chapter_id: Annotated[
                 Optional[int],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_INT_SCHEMA), "description": "Limit pages to a specific chapter."}),
+                WithJsonSchema({**_OPTIONAL_INT_SCHEMA, "description": "Limit pages to a specific chapter."}),
             ] = None,
             id: Annotated[
                 Optional[str],
@@ -393,14 +421,11 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
                 scoped_total = len(pages)
             elif entity_type == "pages" and validated_book_id is not None:
                 book_payload = _bookstack_request("GET", f"/api/books/{validated_book_id}")
-                pages: list = []
-                for entry in book_payload.get("contents", []):
-                    if not isinstance(entry, dict):
-                        continue
-                    if entry.get("type") == "page":
-                        pages.append(entry)
-                    elif entry.get("type") == "chapter":
-                        pages.extend(entry.get("pages", []))
+                pages = list(chain.from_iterable(
+                    (entry,) if entry["type"] == "page" else entry.get("pages", ())
+                    for entry in book_payload.get("contents", [])
+                    if isinstance(entry, dict) and entry.get("type") in ("page", "chapter")
+                ))
                 scoped_items = pages
                 scoped_total = len(pages)
 
@@ -440,22 +465,13 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
                     params["chapter_id"] = validated_chapter_id
 
                 data = _bookstack_request("GET", base_path, params=params)
-
-                predicate = None
-                if entity_type == "chapters" and validated_book_id is not None:
-                    predicate = lambda item: not isinstance(item, dict) or item.get("book_id") == validated_book_id
-                elif entity_type == "pages" and (validated_book_id is not None or validated_chapter_id is not None):
-                    def predicate(item: Any) -> bool:
-                        if not isinstance(item, dict):
-                            return True
-                        if validated_book_id is not None and item.get("book_id") != validated_book_id:
-                            return False
-                        if validated_chapter_id is not None and item.get("chapter_id") != validated_chapter_id:
-                            return False
-                        return True
-
-                filtered_data, matched_count = _filter_collection(data, predicate)
-                data = filtered_data
+                if (
+                    _LIST_PREFETCH_WORKERS > 0
+                    and isinstance(data, dict)
+                    and isinstance(data.get("total"), int)
+                    and data["total"] > offset + count
+                ):
+                    _prefetch_list_page(base_path, params)
 
                 metadata = {"offset": offset, "count": count}
                 if isinstance(data, dict):
@@ -463,11 +479,6 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
                         metadata["total"] = data["total"]
                     if isinstance(data.get("count"), int):
                         metadata["returned"] = data["count"]
-                if matched_count is not None:
-                    metadata["returned"] = matched_count
-                if predicate is not None:
-                    metadata["scoped"] = True
-                    metadata["filter_context"] = filter_scope
 
             result: Dict[str, Any] = {
                 "operation": "list",
@@ -501,11 +512,11 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
             ],
             page: Annotated[
                 Optional[int],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_INT_SCHEMA), "description": "Page number for pagination."}),
+                WithJsonSchema({**_OPTIONAL_INT_SCHEMA, "description": "Page number for pagination."}),
             ] = None,
             count: Annotated[
                 Optional[int],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_INT_SCHEMA), "description": "Number of results per page (max 100)."}),
+                WithJsonSchema({**_OPTIONAL_INT_SCHEMA, "description": "Number of results per page (max 100)."}),
             ] = None,
         ) -> Dict[str, Any]:
             """Search across BookStack content."""
@@ -544,9 +555,8 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
 
             limit = count or 20
             results: list[Dict[str, Any]] = []
-            for item in items_list:
-                if not isinstance(item, dict):
-                    continue
+            dict_items = (item for item in items_list if isinstance(item, dict))
+            for item in islice(dict_items, limit):
                 title = _as_string(item.get("name")) or _as_string(item.get("slug")) or "Untitled"
                 summary = _extract_summary(item)
                 result_item: Dict[str, Any] = {
@@ -569,8 +579,6 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
                         "name": _as_string(chapter.get("name")),
                     }
                 results.append(result_item)
-                if len(results) >= limit:
-                    break
 
             payload: Dict[str, Any] = {
                 "query": query,
@@ -602,27 +610,27 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
             ] = None,
             image: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_NO_MIN_SCHEMA), "description": "Image payload as a base64 string, data URL, or HTTP/HTTPS URL for create/update operations."}),
+                WithJsonSchema({**_OPTIONAL_STRING_NO_MIN_SCHEMA, "description": "Image payload as a base64 string, data URL, or HTTP/HTTPS URL for create/update operations."}),
             ] = None,
             image_type: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_SCHEMA), "description": "Image storage type accepted by BookStack (defaults to 'gallery')."}),
+                WithJsonSchema({**_OPTIONAL_STRING_SCHEMA, "description": "Image storage type accepted by BookStack (defaults to 'gallery')."}),
             ] = "gallery",
             uploaded_to: Annotated[
                 Optional[int],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_INT_SCHEMA), "description": "Entity (page) ID to attach the image to. Provide a valid page ID for uploads."}),
+                WithJsonSchema({**_OPTIONAL_INT_SCHEMA, "description": "Entity (page) ID to attach the image to. Provide a valid page ID for uploads."}),
             ] = None,
             id: Annotated[
                 Optional[int],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_INT_SCHEMA), "description": "Image ID used by read/update/delete operations."}),
+                WithJsonSchema({**_OPTIONAL_INT_SCHEMA, "description": "Image ID used by read/update/delete operations."}),
             ] = None,
             new_name: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_SCHEMA), "description": "Replacement image name for update operations."}),
+                WithJsonSchema({**_OPTIONAL_STRING_SCHEMA, "description": "Replacement image name for update operations."}),
             ] = None,
             new_image: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_NO_MIN_SCHEMA), "description": "Replacement image payload as a base64 string, data URL, or HTTP/HTTPS URL."}),
+                WithJsonSchema({**_OPTIONAL_STRING_NO_MIN_SCHEMA, "description": "Replacement image payload as a base64 string, data URL, or HTTP/HTTPS URL."}),
             ] = None,
             offset: Annotated[
                 Optional[int],
@@ -630,11 +638,11 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
             ] = None,
             count: Annotated[
                 Optional[int],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_INT_SCHEMA), "description": "Number of records to return when listing images."}),
+                WithJsonSchema({**_OPTIONAL_INT_SCHEMA, "description": "Number of records to return when listing images."}),
             ] = None,
             sort: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_NO_MIN_SCHEMA), "description": "Sort expression understood by BookStack (e.g. '-created_at')."}),
+                WithJsonSchema({**_OPTIONAL_STRING_NO_MIN_SCHEMA, "description": "Sort expression understood by BookStack (e.g. '-created_at')."}),
             ] = None,
             filters: Annotated[
                 Optional[list[dict]],
@@ -714,7 +722,7 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
                 return {"operation": operation, "success": True, "data": response}
 
             if operation == "update":
-                _ensure(bool(new_name) or bool(new_image), "Provide new_name, new_image, or both for update operations")
+                _ensure(bool(new_name or new_image), "Provide new_name, new_image, or both for update operations")
 
                 data_payload: Dict[str, Any] = {}
                 files_payload: Dict[str, Tuple[str, bytes, str]] = {}
@@ -759,29 +767,13 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
                 for key, value in normalised_filters:
                     query[f"filter[{key}]"] = value
 
-            cache_key = _build_list_cache_key(query)
-            cached_entry = _get_cached_list(cache_key)
-            if cached_entry is not None:
-                cached_metadata = dict(cached_entry.metadata or {})
-                cached_metadata["cached"] = True
-                return {
-                    "operation": operation,
-                    "success": True,
-                    "data": cached_entry.data,
-                    "metadata": cached_metadata,
-                }
-
-            response = _bookstack_request("GET", "/api/image-gallery", params=query)
-            data, metadata = _normalize_image_list_response(response, offset=resolved_offset, count=resolved_count)
-            _set_cached_list(cache_key, data, metadata)
-            result_metadata = dict(metadata) if metadata else {}
-            result: Dict[str, Any] = {
+            data, metadata = _image_list_request(query, offset=resolved_offset, count=resolved_count)
+            return {
                 "operation": operation,
                 "success": True,
                 "data": data,
-                "metadata": result_metadata,
+                "metadata": metadata,
             }
-            return result
 
     if "bookstack_search_images" not in exclude:
         @track_tool("bookstack_search_images")
@@ -794,11 +786,11 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
         def bookstack_search_images(
             query: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_NO_MIN_SCHEMA), "description": "Text search across image names and descriptions."}),
+                WithJsonSchema({**_OPTIONAL_STRING_NO_MIN_SCHEMA, "description": "Text search across image names and descriptions."}),
             ] = None,
             extension: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_NO_MIN_SCHEMA), "description": "File extension filter (e.g. .jpg, .png)."}),
+                WithJsonSchema({**_OPTIONAL_STRING_NO_MIN_SCHEMA, "description": "File extension filter (e.g. .jpg, .png)."}),
             ] = None,
             size_min: Annotated[
                 Optional[int],
@@ -810,11 +802,11 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
             ] = None,
             created_after: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_NO_MIN_SCHEMA), "description": "Only return images created after this timestamp."}),
+                WithJsonSchema({**_OPTIONAL_STRING_NO_MIN_SCHEMA, "description": "Only return images created after this timestamp."}),
             ] = None,
             created_before: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_NO_MIN_SCHEMA), "description": "Only return images created before this timestamp."}),
+                WithJsonSchema({**_OPTIONAL_STRING_NO_MIN_SCHEMA, "description": "Only return images created before this timestamp."}),
             ] = None,
             used_in: Annotated[
                 Optional[Literal["books", "pages", "chapters"]],
@@ -822,7 +814,7 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
             ] = None,
             count: Annotated[
                 Optional[int],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_INT_SCHEMA), "description": "Results per page (default 20)."}),
+                WithJsonSchema({**_OPTIONAL_INT_SCHEMA, "description": "Results per page (default 20)."}),
             ] = None,
             offset: Annotated[
                 Optional[int],
@@ -830,7 +822,7 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
             ] = None,
             sort: Annotated[
                 Optional[str],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_STRING_NO_MIN_SCHEMA), "description": "Sort expression supported by BookStack (e.g. '-created_at')."}),
+                WithJsonSchema({**_OPTIONAL_STRING_NO_MIN_SCHEMA, "description": "Sort expression supported by BookStack (e.g. '-created_at')."}),
             ] = None,
         ) -> Dict[str, Any]:
             """Advanced discovery tool for BookStack image gallery."""
@@ -877,50 +869,35 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
             resolved_count = count or 20
             resolved_offset = offset or 0
 
-            params: Dict[str, Any] = {"offset": resolved_offset, "count": resolved_count}
-            if query:
-                params["query"] = query
-            if extension:
-                params["extension"] = extension if extension.startswith(".") else f".{extension}"
-            if size_min is not None:
-                params["size_min"] = size_min
-            if size_max is not None:
-                params["size_max"] = size_max
-            if created_after:
-                params["created_after"] = created_after
-            if created_before:
-                params["created_before"] = created_before
-            if used_in:
-                params["used_in"] = used_in
-            if sort:
-                params["sort"] = sort
+            if extension and not extension.startswith("."):
+                extension = f".{extension}"
+
+            # Sizes may legitimately be 0; the string filters are dropped when empty
+            filters: Dict[str, Any] = {
+                key: value
+                for key, value in (
+                    ("query", query),
+                    ("extension", extension),
+                    ("size_min", size_min),
+                    ("size_max", size_max),
+                    ("created_after", created_after),
+                    ("created_before", created_before),
+                    ("used_in", used_in),
+                    ("sort", sort),
+                )
+                if value is not None and value != ""
+            }
+            params: Dict[str, Any] = {"offset": resolved_offset, "count": resolved_count, **filters}
 
-            response = _bookstack_request("GET", "/api/image-gallery", params=params)
-            data, metadata = _normalize_image_list_response(response, offset=resolved_offset, count=resolved_count)
+            data, metadata = _image_list_request(params, offset=resolved_offset, count=resolved_count)
 
-            payload: Dict[str, Any] = {
+            return {
                 "operation": "search",
                 "success": True,
                 "data": data,
                 "metadata": metadata,
+                **filters,
             }
-            if query:
-                payload["query"] = query
-            if extension:
-                payload["extension"] = params["extension"]
-            if size_min is not None:
-                payload["size_min"] = size_min
-            if size_max is not None:
-                payload["size_max"] = size_max
-            if created_after:
-                payload["created_after"] = created_after
-            if created_before:
-                payload["created_before"] = created_before
-            if used_in:
-                payload["used_in"] = used_in
-            if sort:
-                payload["sort"] = sort
-            return payload
 
     if "bookstack_batch_operations" not in exclude:
         @track_tool("bookstack_batch_operations")
@@ -945,7 +922,7 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
             ] = True,
             batch_size: Annotated[
                 Optional[int],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_INT_SCHEMA), "description": "Number of items per batch (processed sequentially)."}),
+                WithJsonSchema({**_OPTIONAL_INT_SCHEMA, "description": "Number of items per batch. Batches run in order. Update and delete items within a batch run concurrently when BS_BATCH_MAX_WORKERS > 1 (default 1), continue_on_error is true and dry_run is false, trading strict request order for throughput; creates always run in item order."}),
             ] = None,
             dry_run: Annotated[
                 bool,
@@ -976,7 +953,7 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
 
             def build_prepared(item: Dict[str, Any]) -> PreparedOperation:
                 item_id = item.get("id")
-                data = _coerce_json_object(item.get("data"), label="batch item 'data'")
+                data = _coerce_json_object(item.get("data"), label="batch item 'data'", copy=False)
                 kwargs = _extract_known_fields(data)
                 kwargs["updates"] = data
                 if operation == "bulk_create":
@@ -1029,6 +1006,7 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
                     content=None,
                     markdown=None,
                     html=None,
+                    cover_image=None,
                     updates=None,
                     book_id=None,
                     chapter_id=None,
@@ -1038,9 +1016,50 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
                     priority=None,
                 )
 
+            logical_op = (
+                "create" if operation == "bulk_create"
+                else "update" if operation == "bulk_update"
+                else "delete"
+            )
+
+            def execute(prepared: PreparedOperation) -> Any:
+                return _bookstack_request(
+                    prepared.method,
+                    prepared.path,
+                    params=prepared.params,
+                    json=prepared.json,
+                )
+
+            def record_success(item_index: int, item: Dict[str, Any], response: Any) -> None:
+                successes.append(
+                    {
+                        "index": item_index,
+                        "result": response,
+                    }
+                )
+                cache_target = None
+                if logical_op == "create" and isinstance(response, dict) and isinstance(response.get("id"), int):
+                    cache_target = response["id"]
+                elif logical_op in {"update", "delete"} and isinstance(item.get("id"), int):
+                    cache_target = item["id"]
+                _invalidate_entity_cache(entity_type, cache_target)
+                collector.record_entity_operation(entity_type, logical_op)
+
+            # Updates and deletes are independent when failures do not stop the
+            # batch, so the requests of a slice can overlap once
+            # BS_BATCH_MAX_WORKERS > 1. Creates stay in order: BookStack orders
+            # unprioritised pages and chapters by arrival.
+            run_concurrently = (
+                not dry_run
+                and continue_on_error
+                and logical_op != "create"
+                and _BATCH_MAX_WORKERS > 1
+            )
+
             index = 0
             while index < total:
                 batch_slice = items[index : index + (batch_size or total)]
+                pending: list[tuple[int, Dict[str, Any], PreparedOperation]] = []
                 for offset_within_batch, item in enumerate(batch_slice):
                     item_index = index + offset_within_batch
                     try:
@@ -1056,31 +1075,11 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
                                 }
                             )
                             continue
+                        if run_concurrently:
+                            pending.append((item_index, item, prepared))
+                            continue
 
-                        response = _bookstack_request(
-                            prepared.method,
-                            prepared.path,
-                            params=prepared.params,
-                            json=prepared.json,
-                        )
-                        successes.append(
-                            {
-                                "index": item_index,
-                                "result": response,
-                            }
-                        )
-                        logical_op = (
-                            "create" if operation == "bulk_create"
-                            else "update" if operation == "bulk_update"
-                            else "delete"
-                        )
-                        cache_target = None
-                        if logical_op == "create" and isinstance(response, dict) and isinstance(response.get("id"), int):
-                            cache_target = response["id"]
-                        elif logical_op in {"update", "delete"} and isinstance(item.get("id"), int):
-                            cache_target = item["id"]
-                        _invalidate_entity_cache(entity_type, cache_target)
-                        collector.record_entity_operation(entity_type, logical_op)
+                        record_success(item_index, item, execute(prepared))
                     except ToolError as exc:
                         errors.append({"index": item_index, "error": str(exc)})
                         if not continue_on_error:
@@ -1090,10 +1089,24 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
                         if not continue_on_error:
                             break
                 else:
+                    outcomes = _run_concurrently(
+                        execute,
+                        [prepared for _, _, prepared in pending],
+                        max_workers=_BATCH_MAX_WORKERS,
+                    )
+                    for (item_index, item, _), (response, exc) in zip(pending, outcomes):
+                        if exc is None:
+                            record_success(item_index, item, response)
+                        else:
+                            errors.append({"index": item_index, "error": str(exc)})
                     index += len(batch_slice)
                     continue
                 break  # loop terminated early due to error and continue_on_error=False
 
+            if run_concurrently:
+                successes.sort(key=lambda entry: entry["index"])
+                errors.sort(key=lambda entry: entry["index"])
+
             return {
                 "operation": operation,
                 "entity_type": entity_type,
@@ -1141,14 +1154,16 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
             """Return health information for the MCP server and BookStack API."""
 
             collector = get_metrics_collector()
-            start_time = time.time()
+            start_time = time.perf_counter()
             api_healthy = True
             api_error: Optional[str] = None
 
-            # Ensure the next request bypasses cache so we measure real latency
-            bookstack_cache.books.invalidate()
+            # Drop only the probe's cached response so we measure real latency
+            # without forcing every other cached book read back to the API
+            probe_params = {"count": 1}
+            bookstack_cache.books.delete(_build_cache_key("GET", "/api/books", probe_params, None))
             try:
-                _bookstack_request("GET", "/api/books", params={"count": 1})
+                _bookstack_request("GET", "/api/books", params=probe_params)
             except ToolError as exc:
                 api_healthy = False
                 api_error = str(exc)
@@ -1156,7 +1171,7 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
                 api_healthy = False
                 api_error = str(exc)
 
-            latency_ms = (time.time() - start_time) * 1000 if api_healthy else None
+            latency_ms = (time.perf_counter() - start_time) * 1000 if api_healthy else None
             summary = collector.get_summary()
             cache_stats = bookstack_cache.get_all_stats()
 
@@ -1191,7 +1206,7 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
             ],
             top_k: Annotated[
                 Optional[int],
-                WithJsonSchema({**copy.deepcopy(_OPTIONAL_INT_SCHEMA), "description": "Maximum number of document chunks to return (default: 5)."}),
+                WithJsonSchema({**_OPTIONAL_INT_SCHEMA, "description": "Maximum number of document chunks to return (default: 5)."}),
             ] = None,
             response_mode: Annotated[
                 Optional[str],
@@ -1279,7 +1294,7 @@ def register_bookstack_tools(mcp: FastMCP, exclude: Optional[set[str]] = None) -
             ).rstrip("/")
 
             try:
-                response = requests.post(
+                response = _get_session().post(
                     hayhooks_url,
                     json=payload,
                     timeout=60,
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import copy
+import json
+import logging
 from typing import Annotated, Any, Dict, Literal, Optional
 
 from fastmcp import FastMCP
@@ -13,22 +14,19 @@ from pydantic.json_schema import WithJsonSchema
 from .tools import (
     _build_content_operation,
     _bookstack_request,
-    _bookstack_request_form,
     _coerce_json_object,
     _ensure,
     _extract_known_fields,
-    _prepare_cover_image_from_gallery,
-    _prepare_form_data,
-    _prepare_image_payload,
+    _run_concurrently,
     _validate_positive_int,
     logger,
     EntityType,
     OperationType,
     BatchOperationType,
     PreparedOperation,
-    PreparedImage,
     ToolError,
 )
+from .schemas import _BATCH_MAX_WORKERS, _schema_copy
 
 
 def truncate_recursive(obj: Any, max_str_len: int = 1000, max_depth: int = 10, current_depth: int = 0) -> Any:
@@ -114,7 +112,7 @@ _SIMPLE_BATCH_ITEMS_SCHEMA: Dict[str, Any] = {
     "description": "List of batch items",
     "minItems": 1,
     "maxItems": 100,
-    "items": copy.deepcopy(_SIMPLE_BATCH_ITEM_SCHEMA),
+    "items": _SIMPLE_BATCH_ITEM_SCHEMA,
 }
 
 _SIMPLIFIED_KNOWN_FIELDS = (
@@ -156,18 +154,55 @@ _USAGE_EXAMPLES = {
 }
 
 
-def _usage_hint(action: str) -> str:
-    """Return a usage example string for the given action."""
-    example = _USAGE_EXAMPLES.get(action, _USAGE_EXAMPLES["_default"])
-    return (
+# Hints are static, so render them once instead of on every failed call
+_USAGE_HINTS = {
+    action: (
         f"Correct format example:\n  {example}\n\n"
         f"IMPORTANT: Fields like chapter_id, book_id, markdown, html, and tags "
         f"MUST go inside the 'data' JSON string parameter, NOT as direct arguments."
     )
+    for action, example in _USAGE_EXAMPLES.items()
+}
+
+_BATCH_USAGE_HINT = (
+    'Correct batch format:\n'
+    '  bookstack_batch_operations(operation="bulk_create", entity_type="page", items=[\n'
+    '    {"data": \'{ "name": "Title", "chapter_id": 245, "markdown": "content" }\'}\n'
+    '  ])\n'
+    'IMPORTANT: All entity fields MUST go inside the item "data" JSON string.'
+)
+
+
+def _batch_type_error(exc: TypeError) -> ToolError:
+    """Translate a malformed-item TypeError into a ToolError with usage help."""
+    message = str(exc)
+    logger.error(message, exc_info=exc)
+    if 'missing' in message and 'required keyword-only arguments' in message:
+        return ToolError(
+            f'Batch item is missing required fields; include entity data in the "data" payload.'
+            f'\n\n{_BATCH_USAGE_HINT}'
+        )
+    if 'multiple values for keyword argument' in message:
+        duplicated = message.split("'")[-2] if "'" in message else 'field'
+        return ToolError(
+            f"Duplicate '{duplicated}' detected inside a batch item. "
+            f"Provide each field once per item.\n\n{_BATCH_USAGE_HINT}"
+        )
+    return ToolError(f"{message}\n\n{_BATCH_USAGE_HINT}")
+
+
+def _usage_hint(action: str) -> str:
+    """Return a usage example string for the given action."""
+    return _USAGE_HINTS.get(action, _USAGE_HINTS["_default"])
 
 
 _ID_FIELD_NAMES = {"book_id", "chapter_id", "image_id"}
 
+# Action dispatch tables, built once rather than on every bookstack_content_crud call
+_VALID_OPERATIONS: frozenset[OperationType] = frozenset({"create", "read", "update", "delete"})
+_VALID_ENTITIES: frozenset[EntityType] = frozenset({"book", "bookshelf", "chapter", "page"})
+_ACTION_ENTITY_ALIASES = {"page": "page", "book": "book", "chapter": "chapter", "shelf": "bookshelf"}
+
 
 def _normalise_optional_id_value(value: Optional[Any]) -> Optional[Any]:
     """Treat empty/zero identifiers as absent while preserving positive inputs."""
@@ -222,7 +257,9 @@ def _prepare_simplified_fields(
 
     if isinstance(parsed_data, dict):
         extracted = _extract_known_fields(parsed_data)
-        updates = copy.deepcopy(parsed_data)
+        # Only top-level keys are replaced or popped below, and the content
+        # builder copies the payload again, so nested values can be shared.
+        updates = dict(parsed_data)
 
     merged: Dict[str, Optional[Any]] = {}
     for field in _SIMPLIFIED_KNOWN_FIELDS:
@@ -271,7 +308,6 @@ def register_simplified_bookstack_tools(mcp: FastMCP) -> None:
             description: Entity description (for create/update)
             data: Additional fields as JSON string (e.g. '{"content":"...","book_id":1}')
         """
-        import json as json_module
         logger.info(
             "bookstack_simplified.content_crud",
             extra={
@@ -284,18 +320,15 @@ def register_simplified_bookstack_tools(mcp: FastMCP) -> None:
 
         # Parse action into operation and entity_type
         parts = action.split("_", 1)
-        _VALID_OPERATIONS: set[OperationType] = {"create", "read", "update", "delete"}
-        _VALID_ENTITIES: set[EntityType] = {"book", "bookshelf", "chapter", "page"}
         raw_op = parts[0]
         _ensure(raw_op in _VALID_OPERATIONS, f"Invalid operation '{raw_op}'. Must be one of: {', '.join(_VALID_OPERATIONS)}")
         operation: OperationType = raw_op  # type: ignore[assignment]  # validated above
-        entity_map = {"page": "page", "book": "book", "chapter": "chapter", "shelf": "bookshelf"}
-        raw_entity = entity_map.get(parts[1], parts[1]) if len(parts) > 1 else ""
+        raw_entity = _ACTION_ENTITY_ALIASES.get(parts[1], parts[1]) if len(parts) > 1 else ""
         _ensure(raw_entity in _VALID_ENTITIES, f"Invalid entity type '{raw_entity}'. Must be one of: {', '.join(_VALID_ENTITIES)}")
         entity_type: EntityType = raw_entity  # type: ignore[assignment]  # validated above
 
         try:
-            parsed_data = _coerce_json_object(data, label="data") if data else {}
+            parsed_data = _coerce_json_object(data, label="data", copy=False) if data else {}
             overrides = {
                 "name": name,
                 "description": description,
@@ -346,18 +379,28 @@ def register_simplified_bookstack_tools(mcp: FastMCP) -> None:
             raise
         except Exception as e:
             hint = _usage_hint(action)
-            logger.error(f'Error in bookstack_content_crud: {e}', exc_info=True)
+            logger.error("Error in bookstack_content_crud: %s", e, exc_info=True)
             raise ToolError(f"{e}\n\n{hint}") from e
 
+        # Size logging serialises the whole response, so only pay for it when
+        # INFO records are actually emitted
+        log_sizes = logger.isEnabledFor(logging.INFO)
+
         # Apply aggressive truncation for read operations
         if operation == "read":
-            original_size = len(json_module.dumps(response))
-            logger.info(f"Original response size: {original_size} bytes")
+            if log_sizes:
+                original_size = len(json.dumps(response))
+                logger.info("Original response size: %d bytes", original_size)
 
             response = truncate_recursive(response, max_str_len=1000)
 
-            truncated_size = len(json_module.dumps(response))
-            logger.info(f"Truncated response size: {truncated_size} bytes (reduced by {original_size - truncated_size} bytes)")
+            if log_sizes:
+                truncated_size = len(json.dumps(response))
+                logger.info(
+                    "Truncated response size: %d bytes (reduced by %d bytes)",
+                    truncated_size,
+                    original_size - truncated_size,
+                )
 
         result: Dict[str, Any] = {
             "action": action,
@@ -371,8 +414,8 @@ def register_simplified_bookstack_tools(mcp: FastMCP) -> None:
         elif isinstance(response, dict) and isinstance(response.get("id"), int):
             result["content_id"] = response["id"]
 
-        result_size = len(json_module.dumps(result))
-        logger.info(f"bookstack_content_crud RETURNING: success=True, result_size={result_size} bytes")
+        if log_sizes:
+            logger.info("bookstack_content_crud RETURNING: success=True, result_size=%d bytes", len(json.dumps(result)))
 
         return result
 
@@ -393,7 +436,7 @@ def register_simplified_bookstack_tools(mcp: FastMCP) -> None:
         items: Annotated[
             list[Dict[str, Any]],
             WithJsonSchema({
-                **copy.deepcopy(_SIMPLE_BATCH_ITEMS_SCHEMA),
+                **_schema_copy(_SIMPLE_BATCH_ITEMS_SCHEMA),
                 "description": "List of items to process"
             }),
         ],
@@ -430,7 +473,7 @@ def register_simplified_bookstack_tools(mcp: FastMCP) -> None:
 
         def build_prepared(item: Dict[str, Any]) -> PreparedOperation:
             item_id = item.get("id")
-            data = _coerce_json_object(item.get("data"), label="batch item 'data'")
+            data = _coerce_json_object(item.get("data"), label="batch item 'data'", copy=False)
             overrides: Dict[str, Optional[Any]] = {}
             simplified_fields, clean_updates = _prepare_simplified_fields(data, overrides)
 
@@ -494,6 +537,26 @@ def register_simplified_bookstack_tools(mcp: FastMCP) -> None:
                 priority=None,
             )
 
+        def execute(prepared: PreparedOperation) -> Any:
+            return _bookstack_request(
+                prepared.method,
+                prepared.path,
+                params=prepared.params,
+                json=prepared.json,
+            )
+
+        # Updates and deletes are independent when failures do not stop the
+        # batch, so their requests can overlap once BS_BATCH_MAX_WORKERS > 1.
+        # Creates stay in order: BookStack orders unprioritised pages and
+        # chapters by arrival.
+        run_concurrently = (
+            not dry_run
+            and continue_on_error
+            and operation != "bulk_create"
+            and _BATCH_MAX_WORKERS > 1
+        )
+        pending: list[tuple[int, PreparedOperation]] = []
+
         for item_index, item in enumerate(items):
             try:
                 prepared = build_prepared(item)
@@ -506,46 +569,38 @@ def register_simplified_bookstack_tools(mcp: FastMCP) -> None:
                         "payload": prepared.json,
                     })
                     continue
+                if run_concurrently:
+                    pending.append((item_index, prepared))
+                    continue
 
-                response = _bookstack_request(
-                    prepared.method,
-                    prepared.path,
-                    params=prepared.params,
-                    json=prepared.json,
-                )
+                response = execute(prepared)
                 successes.append({
                     "index": item_index,
                     "result": response,
                 })
             except TypeError as exc:
-                message = str(exc)
-                batch_hint = (
-                    'Correct batch format:\n'
-                    '  bookstack_batch_operations(operation="bulk_create", entity_type="page", items=[\n'
-                    '    {"data": \'{ "name": "Title", "chapter_id": 245, "markdown": "content" }\'}\n'
-                    '  ])\n'
-                    'IMPORTANT: All entity fields MUST go inside the item "data" JSON string.'
-                )
-                if 'missing' in message and 'required keyword-only arguments' in message:
-                    logger.error(message, exc_info=True)
-                    raise ToolError(
-                        f'Batch item is missing required fields; include entity data in the "data" payload.'
-                        f'\n\n{batch_hint}'
-                    ) from exc
-                if 'multiple values for keyword argument' in message:
-                    duplicated = message.split("'")[-2] if "'" in message else 'field'
-                    logger.error(message, exc_info=True)
-                    raise ToolError(
-                        f"Duplicate '{duplicated}' detected inside a batch item. "
-                        f"Provide each field once per item.\n\n{batch_hint}"
-                    ) from exc
-                logger.error(message, exc_info=True)
-                raise ToolError(f"{message}\n\n{batch_hint}") from exc
+                raise _batch_type_error(exc) from exc
             except (ToolError, Exception) as exc:
                 errors.append({'index': item_index, 'error': str(exc)})
                 if not continue_on_error:
                     break
 
+        if pending:
+            outcomes = _run_concurrently(
+                execute,
+                [prepared for _, prepared in pending],
+                max_workers=_BATCH_MAX_WORKERS,
+            )
+            for (item_index, _), (response, exc) in zip(pending, outcomes):
+                if exc is None:
+                    successes.append({"index": item_index, "result": response})
+                elif isinstance(exc, TypeError):
+                    raise _batch_type_error(exc) from exc
+                else:
+                    errors.append({'index': item_index, 'error': str(exc)})
+            successes.sort(key=lambda entry: entry["index"])
+            errors.sort(key=lambda entry: entry["index"])
+
         return {
             "operation": operation,
             "entity_type": entity_type,
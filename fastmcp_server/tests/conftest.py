@@ -4,6 +4,18 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breaker():
+    """Keep the process-wide circuit breaker closed between tests."""
+    from fastmcp_server.bookstack import api_client
+
+    api_client._CIRCUIT_BREAKER.reset()
+    yield
+    api_client._CIRCUIT_BREAKER.reset()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import threading
 
 import pytest
 from fastmcp import FastMCP
@@ -134,3 +135,65 @@ async def test_batch_accepts_string_payload(monkeypatch: MonkeyPatch) -> None:
     )
 
     assert calls == [("PUT", "/api/books/3", {"name": "String Name"})]
+
+
+@pytest.mark.asyncio
+async def test_batch_concurrent_results_keep_item_order(monkeypatch: MonkeyPatch) -> None:
+    mcp = FastMCP("test")
+    register_bookstack_tools(mcp)
+
+    def fake_request(method: str, path: str, *, params=None, json=None):
+        if path.endswith("/2"):
+            raise ToolError("not found")
+        return {"deleted": path}
+
+    monkeypatch.setattr(tools, "_bookstack_request", fake_request)
+    monkeypatch.setattr(tools, "_BATCH_MAX_WORKERS", 4)
+
+    tool = await mcp.get_tool("bookstack_batch_operations")
+    result = await tool.run(
+        {
+            "operation": "bulk_delete",
+            "entity_type": "page",
+            "continue_on_error": True,
+            "batch_size": 2,
+            "items": [{"id": n} for n in (1, 2, 3, 4, 5)],
+        }
+    )
+
+    data = json.loads(result.content[0].text)
+    assert [entry["index"] for entry in data["results"]] == [0, 2, 3, 4]
+    assert [entry["result"]["deleted"] for entry in data["results"]] == [
+        "/api/pages/1", "/api/pages/3", "/api/pages/4", "/api/pages/5",
+    ]
+    assert [entry["index"] for entry in data["errors"]] == [1]
+
+
+@pytest.mark.asyncio
+async def test_batch_create_stays_sequential(monkeypatch: MonkeyPatch) -> None:
+    mcp = FastMCP("test")
+    register_bookstack_tools(mcp)
+
+    calls = []
+
+    def fake_request(method: str, path: str, *, params=None, json=None):
+        calls.append((json["name"], threading.get_ident()))
+        return {"id": len(calls)}
+
+    monkeypatch.setattr(tools, "_bookstack_request", fake_request)
+    monkeypatch.setattr(tools, "_BATCH_MAX_WORKERS", 4)
+
+    tool = await mcp.get_tool("bookstack_batch_operations")
+    result = await tool.run(
+        {
+            "operation": "bulk_create",
+            "entity_type": "book",
+            "continue_on_error": True,
+            "items": [{"data": {"name": f"Book {n}", "description": "d"}} for n in range(5)],
+        }
+    )
+
+    data = json.loads(result.content[0].text)
+    assert data["success_count"] == 5
+    assert [name for name, _ in calls] == [f"Book {n}" for n in range(5)]
+    assert {thread for _, thread in calls} == {threading.get_ident()}
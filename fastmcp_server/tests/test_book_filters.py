@@ -118,3 +118,49 @@ async def test_books_listing_returns_metadata() -> None:
     assert response["data"] == api_response
     assert response["metadata"]["total"] == 2
     assert response["metadata"]["returned"] == 2
+
+
+@pytest.mark.asyncio
+async def test_pages_with_book_scope_keep_content_order_and_skip_other_entries() -> None:
+    book = {
+        "id": 1,
+        "contents": [
+            {
+                "type": "chapter",
+                "id": 20,
+                "pages": [{"type": "page", "id": 201}, {"type": "page", "id": 202}],
+            },
+            "not-an-entry",
+            {"type": "page", "id": 101},
+            {"type": "chapter", "id": 21},
+            {"type": "unknown", "id": 999, "pages": [{"id": 998}]},
+        ],
+    }
+
+    response, _, _ = await _invoke_list_tool({"entity_type": "pages", "book_id": 1}, book)
+
+    assert [item["id"] for item in response["data"]["data"]] == [201, 202, 101]
+    assert response["data"]["total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_pages_with_book_scope_paginate_after_filtering() -> None:
+    book = {
+        "id": 1,
+        "contents": [
+            {"type": "chapter", "id": 20, "pages": [{"type": "page", "id": n} for n in (201, 202, 203)]},
+            {"type": "page", "id": 101},
+            {"type": "page", "id": 102},
+        ],
+    }
+
+    response, args, _ = await _invoke_list_tool(
+        {"entity_type": "pages", "book_id": 1, "offset": 2, "count": 2},
+        book,
+    )
+
+    assert args == ("GET", "/api/books/1")
+    assert [item["id"] for item in response["data"]["data"]] == [203, 101]
+    assert response["data"]["total"] == 5
+    assert response["metadata"]["returned"] == 2
+    assert response["metadata"]["total"] == 5
@@ -38,6 +38,11 @@ def test_smart_cache_invalidate_by_tags() -> None:
     assert cache.get("book-detail") == {"id": 3}
 
 
+def _sent_json(json_payload, data):
+    """Return the JSON body regardless of whether it was sent as json= or encoded data=."""
+    return json_payload if json_payload is not None else json.loads(data)
+
+
 def test_page_update_invalidates_cached_detail_read(monkeypatch: pytest.MonkeyPatch) -> None:
     """A write should evict the cached GET for the same entity."""
     state = {"get_count": 0, "name": "Page v1"}
@@ -46,8 +51,8 @@ def test_page_update_invalidates_cached_detail_read(monkeypatch: pytest.MonkeyPa
         def __init__(self, payload: dict[str, object], status_code: int = 200):
             self._payload = payload
             self.status_code = status_code
-            self.content = b"json"
             self.text = json.dumps(payload)
+            self.content = self.text.encode("utf-8")
 
         def raise_for_status(self) -> None:
             return None
@@ -55,16 +60,17 @@ def test_page_update_invalidates_cached_detail_read(monkeypatch: pytest.MonkeyPa
         def json(self) -> dict[str, object]:
             return dict(self._payload)
 
-    def fake_request(method: str, url: str, *, headers=None, params=None, json=None, timeout=None):
+    def fake_request(method: str, url: str, *, headers=None, params=None, json=None, data=None, timeout=None):
         if method == "GET" and url.endswith("/api/pages/7"):
             state["get_count"] += 1
             return FakeResponse({"id": 7, "name": state["name"]})
         if method == "PUT" and url.endswith("/api/pages/7"):
-            state["name"] = json["name"] if isinstance(json, dict) else state["name"]
+            body = _sent_json(json, data)
+            state["name"] = body["name"] if isinstance(body, dict) else state["name"]
             return FakeResponse({"id": 7, "name": state["name"]})
         raise AssertionError(f"Unexpected request: {method} {url}")
 
-    monkeypatch.setattr("requests.request", fake_request)
+    monkeypatch.setattr(tools._get_session(), "request", fake_request)
     monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://bookstack.example.com")
     monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -79,3 +85,18 @@ def test_page_update_invalidates_cached_detail_read(monkeypatch: pytest.MonkeyPa
     assert second_payload["name"] == "Page v1"
     assert updated_payload["name"] == "Page v2"
     assert third_payload["name"] == "Page v2"
+
+
+def test_build_cache_key_uses_tuples_for_plain_params() -> None:
+    first = tools._build_cache_key("get", "/api/books", {"offset": 0, "count": 5}, None)
+    second = tools._build_cache_key("GET", "/api/books", {"count": 5, "offset": 0}, None)
+
+    assert first == second == ("GET", "/api/books", (("count", 5), ("offset", 0)))
+
+
+def test_build_cache_key_keeps_bools_and_ints_apart() -> None:
+    flag = tools._build_cache_key("GET", "/api/books", {"x": True}, None)
+    number = tools._build_cache_key("GET", "/api/books", {"x": 1}, None)
+
+    assert isinstance(flag, str)
+    assert flag != number
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from typing import Any
 
 import pytest
 
-from fastmcp_server.bookstack.cache import BookStackCache, SmartCache
+from fastmcp_server.bookstack.cache import BookStackCache, SmartCache, cached
 
 
 @pytest.fixture
@@ -142,6 +143,36 @@ class TestSmartCache:
         # key2 should remain (3 hits)
         assert cache.get("key2") == "value2"
 
+    def test_eviction_spares_hot_entry_at_lru_end(self):
+        """Test that a frequently hit entry outlives a colder neighbour."""
+        cache = SmartCache(max_size=20, default_ttl=60)
+        for i in range(20):
+            cache.set(f"key{i}", i)
+
+        cache.get("key0")
+        cache.get("key0")
+        for i in range(1, 20):
+            cache.get(f"key{i}")
+
+        # key0 is least recent but hottest; key1 is the next-oldest with one hit
+        cache.set("key20", 20)
+
+        assert cache.get("key0") == 0
+        assert cache.get("key1") is None
+
+    def test_eviction_reclaims_expired_entries_first(self):
+        """Test that expired entries are dropped before any live entry."""
+        cache = SmartCache(max_size=2, default_ttl=60)
+        cache.set("stale", "value", ttl=0.1)
+        cache.set("fresh", "value")
+        cache.get("stale")
+        time.sleep(0.15)
+
+        cache.set("new", "value")
+
+        assert cache.get("fresh") == "value"
+        assert cache.get_stats()["evictions"] == 0
+
     def test_invalidate_clears_entire_cache(self, cache):
         """Test that invalidate() clears entire cache."""
         cache.set("key1", "value1")
@@ -185,6 +216,26 @@ class TestSmartCache:
         assert cache.get("books:2") is None
         assert cache.get("pages:1") == "page1"
 
+    def test_delete_removes_single_entry(self, cache):
+        """Test that delete removes only the requested key."""
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+
+        assert cache.delete("key1") is True
+        assert cache.delete("key1") is False
+        assert cache.get("key1") is None
+        assert cache.get("key2") == "value2"
+
+    def test_overwrite_replaces_tags(self, cache):
+        """Test that re-setting a key drops the tags of the previous entry."""
+        cache.set("key1", "old", tags={"old-tag"})
+        cache.set("key1", "new", tags={"new-tag"})
+
+        assert cache.invalidate(tags={"old-tag"}) == 0
+        assert cache.get("key1") == "new"
+        assert cache.invalidate(tags={"new-tag"}) == 1
+        assert cache.get("key1") is None
+
     def test_get_stats_returns_hit_rate(self, cache):
         """Test that get_stats calculates hit rate correctly."""
         cache.set("key1", "value1")
@@ -227,6 +278,23 @@ class TestSmartCache:
         assert "evictions" in stats
         assert "expired" in stats
 
+    def test_get_stats_sums_counters_across_shards(self):
+        """Test that per-shard counters are totalled in get_stats."""
+        cache = SmartCache(max_size=2048, default_ttl=60)
+        for n in range(100):
+            cache.set(f"key{n}", n)
+        for n in range(100):
+            cache.get(f"key{n}")
+        for n in range(30):
+            cache.get(f"missing{n}")
+
+        stats = cache.get_stats()
+
+        assert len(cache._shards) > 1
+        assert stats["hits"] == 100
+        assert stats["misses"] == 30
+        assert stats["total_requests"] == 130
+
 
 class TestBookStackCache:
     """Test BookStackCache specialized caches."""
@@ -351,3 +419,92 @@ class TestBookStackCache:
         assert cache.books.get("key1") is None
         # Other entities should remain (note: collection tags also match, so both get cleared)
         # The implementation invalidates all matching tags, including collection tags
+
+
+class TestCachedDecorator:
+    """Test the cached() function decorator."""
+
+    def test_cached_reuses_result_for_same_arguments(self):
+        """Test that repeated calls with equal arguments hit the cache."""
+        calls = []
+
+        @cached(ttl=60, key_prefix="test")
+        def load(item_id, *, detail=False):
+            calls.append((item_id, detail))
+            return {"id": item_id, "detail": detail}
+
+        assert load(1, detail=True) == {"id": 1, "detail": True}
+        assert load(1, detail=True) == {"id": 1, "detail": True}
+        assert load(2) == {"id": 2, "detail": False}
+        assert calls == [(1, True), (2, False)]
+
+    def test_cache_invalidate_only_clears_decorated_function(self):
+        """Test that invalidating one function leaves similarly named ones cached."""
+        calls = []
+
+        @cached(ttl=60, key_prefix="scope")
+        def get_book(item_id):
+            calls.append(("book", item_id))
+            return item_id
+
+        @cached(ttl=60, key_prefix="scope")
+        def get_books(item_id):
+            calls.append(("books", item_id))
+            return item_id
+
+        get_book(1)
+        get_books(1)
+        get_book.cache_invalidate()
+        get_book(1)
+        get_books(1)
+
+        assert calls == [("book", 1), ("books", 1), ("book", 1)]
+
+    def test_concurrent_misses_call_function_once(self):
+        """Test that simultaneous misses for one key share a single call."""
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        @cached(ttl=60, key_prefix="flight")
+        def slow_load(item_id):
+            calls.append(item_id)
+            started.set()
+            release.wait(timeout=5)
+            return {"id": item_id}
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(slow_load(7)))
+        leader.start()
+        assert started.wait(timeout=5)
+
+        followers = [
+            threading.Thread(target=lambda: results.append(slow_load(7)))
+            for _ in range(4)
+        ]
+        for thread in followers:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(timeout=5)
+
+        assert calls == [7]
+        assert results == [{"id": 7}] * 5
+
+    def test_cached_keeps_equal_hashing_arguments_apart(self):
+        """Test that 1, True and 1.0 map to separate cache entries."""
+        calls = []
+
+        @cached(ttl=60, key_prefix="scalar")
+        def load(value, tags=None):
+            calls.append(value)
+            return repr(value)
+
+        assert load(1) == "1"
+        assert load(True) == "True"
+        assert load(1.0) == "1.0"
+        assert load(1) == "1"
+        assert load(1, tags=["a"]) == "1"
+        assert load(1, tags=["a"]) == "1"
+        assert calls == [1, True, 1.0, 1]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import base64
 import json
 from typing import Any, Dict
 
@@ -66,6 +67,20 @@ class TestFormatTags:
         assert len(result) == 1
         assert result[0]["name"] == "key1"
 
+    def test_format_tags_mixed_dicts_and_objects(self):
+        """Test that dicts and tag objects can be mixed and values are stringified."""
+        class TagObj:
+            def __init__(self, name, value):
+                self.name = name
+                self.value = value
+
+        result = tools._format_tags([{"name": "year", "value": 2024}, TagObj("key1", "value1")])
+
+        assert result == [
+            {"name": "year", "value": "2024"},
+            {"name": "key1", "value": "value1"},
+        ]
+
 
 class TestNormaliseBooks:
     """Test _normalise_books helper function."""
@@ -228,6 +243,11 @@ class TestCoerceJsonObject:
         # Should be a new dict, not the same object
         assert result is not data
 
+    def test_coerce_json_object_dict_without_copy(self):
+        """Test that copy=False hands back the caller's dict unchanged."""
+        data = {"name": "Test"}
+        assert tools._coerce_json_object(data, label="test", copy=False) is data
+
     def test_coerce_json_object_json_string_parsed(self):
         """Test that JSON string is parsed."""
         json_str = '{"name": "Test", "id": 123}'
@@ -404,3 +424,231 @@ class TestValidatedDescription:
         long_desc = "x" * 20001
         with pytest.raises(ToolError):
             tools._validated_description(long_desc, "book")
+
+
+class TestToolError:
+    """Test _tool_error message formatting."""
+
+    def test_tool_error_renders_hint_and_context(self):
+        """Test that the message carries the hint and an indented context dump."""
+        error = tools._tool_error("Failed", hint="Retry later", context={"id": 7, "tags": {"a"}})
+
+        assert isinstance(error, ToolError)
+        message = str(error)
+        assert message.startswith("Failed\nHint: Retry later\nContext:\n")
+        assert json.loads(message.split("Context:\n", 1)[1]) == {"id": 7, "tags": "{'a'}"}
+
+    def test_tool_error_without_context(self):
+        """Test that a bare message is left untouched."""
+        assert str(tools._tool_error("Failed")) == "Failed"
+
+
+class TestIsUrl:
+    """Test _is_url helper function."""
+
+    def test_is_url_accepts_http_schemes_case_insensitively(self):
+        """Test that HTTP(S) URLs are accepted regardless of scheme case or padding."""
+        assert tools._is_url("https://example.com/cat.png") is True
+        assert tools._is_url("  HTTP://example.com/cat.png ") is True
+
+    def test_is_url_rejects_other_inputs(self):
+        """Test that base64, data URLs, other schemes and host-less URLs are rejected."""
+        assert tools._is_url("iVBORw0KGgoAAAANSUhEUgAAAAEAAAAB") is False
+        assert tools._is_url("data:image/png;base64,AAAA") is False
+        assert tools._is_url("ftp://example.com/cat.png") is False
+        assert tools._is_url("https://") is False
+
+
+class TestParseUrl:
+    """Test _parse_url memoisation bounds."""
+
+    def test_only_url_sized_strings_are_memoised(self):
+        """Test that oversized inputs are parsed without entering the cache."""
+        from fastmcp_server.bookstack.image_handling import _parse_url, _parse_url_cached
+
+        _parse_url_cached.cache_clear()
+        short_url = "https://example.com/a.png"
+        long_url = "https://example.com/" + "a" * 10_000
+
+        assert _parse_url(short_url) is _parse_url(short_url)
+        assert _parse_url(long_url).netloc == "example.com"
+        assert _parse_url_cached.cache_info().currsize == 1
+
+
+class TestPrepareImagePayload:
+    """Test _prepare_image_payload data URL handling."""
+
+    def test_data_url_base64_payload_decoded(self):
+        """Test that the MIME type and payload are split at the header comma."""
+        prepared = tools._prepare_image_payload("data:image/png;base64,iVBORw0KGgo=", "cover.png")
+
+        assert prepared.mime_type == "image/png"
+        assert prepared.content == b"\x89PNG\r\n\x1a\n"
+
+    def test_data_url_line_wrapped_payload_decoded(self):
+        """Test that base64 wrapped over several lines is still recognised as a data URL."""
+        prepared = tools._prepare_image_payload("DATA:image/gif;base64,R0lG\nODlh", "cover.gif")
+
+        assert prepared.mime_type == "image/gif"
+        assert prepared.content == b"GIF89a"
+
+    def test_invalid_base64_raises_tool_error(self):
+        """Test that malformed base64 surfaces as a ToolError whichever decoder is active."""
+        with pytest.raises(ToolError, match="Failed to decode base64 image data"):
+            tools._prepare_image_payload("not*base64!", "cover.png")
+
+    def test_base64_whitespace_stripped_before_decoding(self):
+        """Test that any whitespace \\s matches is removed, including form feeds and NBSP."""
+        prepared = tools._prepare_image_payload("R0lG\r\nOD\x0clh ", "cover.gif")
+
+        assert prepared.content == b"GIF89a"
+
+
+class TestPrepareImagePayloadMemory:
+    """Test that raw image payloads are not retained by URL memoisation."""
+
+    def test_payloads_do_not_enter_url_cache(self, monkeypatch):
+        """Test that base64 and data URL uploads never reach the URL helpers' cache."""
+        from fastmcp_server.bookstack import image_handling
+
+        def fail_is_url(value):
+            raise AssertionError("_is_url should not see non-URL payloads")
+
+        monkeypatch.setattr(image_handling, "_is_url", fail_is_url)
+        image_handling._parse_url_cached.cache_clear()
+        encoded = base64.b64encode(b"\x89PNG" + b"\x00" * 4096).decode()
+
+        image_handling._prepare_image_payload(encoded, "a.png")
+        image_handling._prepare_image_payload(f"data:image/png;base64,{encoded}", "b.png")
+
+        assert image_handling._parse_url_cached.cache_info().currsize == 0
+
+
+class TestBuildListCacheKey:
+    """Test _build_list_cache_key helper function."""
+
+    def test_key_ignores_parameter_order(self):
+        """Test that equal parameters in any order give the same hashable key."""
+        first = tools._build_list_cache_key({"offset": 0, "count": 20, "filter[type]": "gallery"})
+        second = tools._build_list_cache_key({"filter[type]": "gallery", "count": 20, "offset": 0})
+
+        assert first == second
+        assert hash(first) == hash(second)
+        assert first != tools._build_list_cache_key({"offset": 20, "count": 20, "filter[type]": "gallery"})
+
+    def test_unhashable_values_fall_back_to_digest(self):
+        """Test that nested unhashable values still produce a stable key."""
+        params = {"filter": {"tags": ["a", "b"]}}
+
+        key = tools._build_list_cache_key(params)
+
+        assert isinstance(key, str)
+        assert key == tools._build_list_cache_key(params)
+
+
+class TestEnsureIso8601:
+    """Test _ensure_iso8601 helper function."""
+
+    def test_zulu_suffix_parsed_as_utc(self):
+        """Test that a trailing Z is accepted as UTC."""
+        parsed = tools._ensure_iso8601("2025-09-27T18:00:00Z", "'created_after'")
+
+        assert parsed.utcoffset() is not None and parsed.utcoffset().total_seconds() == 0
+
+    def test_invalid_value_raises_every_time(self):
+        """Test that invalid strings keep raising ToolError on repeat calls."""
+        for _ in range(2):
+            with pytest.raises(ToolError, match="'created_after' must be an ISO-8601"):
+                tools._ensure_iso8601("yesterday", "'created_after'")
+
+
+class TestPrepareFormData:
+    """Test _prepare_form_data helper function."""
+
+    def test_values_converted_to_form_fields(self):
+        """Test scalar, nested and skipped values in a multipart payload."""
+        import enum
+
+        class Kind(str, enum.Enum):
+            BOOK = "book"
+
+        form = tools._prepare_form_data({
+            "name": "Guide",
+            "priority": 3,
+            "draft": False,
+            "kind": Kind.BOOK,
+            "tags": [{"name": "a", "value": "b"}],
+            "description": None,
+            "image_id": 9,
+            "cover_image": "data:...",
+        })
+
+        assert json.loads(form.pop("tags")) == [{"name": "a", "value": "b"}]
+        assert form == {
+            "name": "Guide",
+            "priority": "3",
+            "draft": "False",
+            "kind": "book",
+        }
+
+
+class TestNormaliseFilters:
+    """Test _normalise_filters helper function."""
+
+    def test_entries_become_key_value_pairs(self):
+        """Test that keys are trimmed and values stringified in input order."""
+        result = tools._normalise_filters([{"key": " name ", "value": "Cover"}, {"key": "uploaded_to", "value": 7}])
+
+        assert result == [("name", "Cover"), ("uploaded_to", "7")]
+
+    @pytest.mark.parametrize(
+        ("entry", "message"),
+        [
+            ({"value": "x"}, "non-empty 'key'"),
+            ("name=x", "non-empty 'key'"),
+            ({"key": "name"}, "require a 'value'"),
+        ],
+    )
+    def test_invalid_entries_raise(self, entry, message):
+        """Test that malformed entries raise ToolError."""
+        with pytest.raises(ToolError, match=message):
+            tools._normalise_filters([entry])
+
+
+class TestMakeResult:
+    """Test _make_result helper function."""
+
+    def test_fallback_id_wins_over_response_id(self):
+        """Test that an explicit id is kept even when the response carries one."""
+        result = tools._make_result("update", "page", {"id": 9}, 3)
+
+        assert result == {"operation": "update", "entity_type": "page", "success": True, "data": {"id": 9}, "id": 3}
+
+    def test_response_id_used_without_fallback(self):
+        """Test that the created entity id is lifted from the response."""
+        assert tools._make_result("create", "book", {"id": 12}, None)["id"] == 12
+
+    def test_non_integer_response_id_is_ignored(self):
+        """Test that no id key is added when the response id is not an int."""
+        assert "id" not in tools._make_result("create", "book", {"id": "12"}, None)
+
+
+class TestRunConcurrently:
+    """Test _run_concurrently helper function."""
+
+    def test_outcomes_follow_input_order(self):
+        """Test that results and errors line up with their arguments."""
+
+        def work(value):
+            if value == 2:
+                raise ToolError("boom")
+            return value * 10
+
+        outcomes = tools._run_concurrently(work, [1, 2, 3], max_workers=3)
+
+        assert [result for result, _ in outcomes] == [10, None, 30]
+        assert [str(error) if error else None for _, error in outcomes] == [None, "boom", None]
+
+    def test_empty_input_runs_nothing(self):
+        """Test that no pool is needed for an empty batch."""
+        assert tools._run_concurrently(pytest.fail, [], max_workers=4) == []
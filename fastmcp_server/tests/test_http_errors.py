@@ -1,13 +1,18 @@
 """Comprehensive tests for HTTP error handling in BookStack request functions."""
 from __future__ import annotations
 
+import http.server
 import json
+import threading
+import urllib.request
 from typing import Any, Dict, Optional
 
 import pytest
 import requests
 from pytest import MonkeyPatch
+from urllib3.util.retry import Retry
 
+import fastmcp_server.bookstack.api_client as api_client
 import fastmcp_server.bookstack.tools as tools
 from fastmcp_server.bookstack.tools import ToolError
 
@@ -48,7 +53,7 @@ class TestBookstackRequestHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
             return FakeResponse(401, {"error": "Unauthorized"})
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -67,7 +72,7 @@ class TestBookstackRequestHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
             return FakeResponse(403, {"error": "Forbidden"})
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -85,7 +90,7 @@ class TestBookstackRequestHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
             return FakeResponse(404, {"error": "Not found"})
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -104,7 +109,7 @@ class TestBookstackRequestHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
             return FakeResponse(409, {"error": "Conflict: name already exists"})
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -122,7 +127,7 @@ class TestBookstackRequestHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
             return FakeResponse(422, {"error": "Validation failed", "details": {"name": "required"}})
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -140,7 +145,7 @@ class TestBookstackRequestHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
             return FakeResponse(500, {"error": "Internal server error"})
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -156,7 +161,7 @@ class TestBookstackRequestHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> None:
             raise requests.exceptions.Timeout("Connection timed out")
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -173,7 +178,7 @@ class TestBookstackRequestHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> None:
             raise requests.exceptions.ConnectionError("Failed to connect")
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -202,7 +207,7 @@ class TestBookstackRequestHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> NonJSONResponse:
             return NonJSONResponse()
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -219,7 +224,7 @@ class TestBookstackRequestHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
             return FakeResponse(404, {"error": "Book not found", "message": "No book with ID 999"})
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -239,7 +244,7 @@ class TestBookstackRequestFormHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
             return FakeResponse(401, {"error": "Unauthorized"})
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -258,7 +263,7 @@ class TestBookstackRequestFormHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
             return FakeResponse(403, {"error": "Forbidden"})
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -276,7 +281,7 @@ class TestBookstackRequestFormHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
             return FakeResponse(404, {"error": "Image not found"})
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -295,7 +300,7 @@ class TestBookstackRequestFormHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
             return FakeResponse(409, {"error": "Image name already exists"})
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -313,7 +318,7 @@ class TestBookstackRequestFormHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
             return FakeResponse(422, {"error": "Invalid image data"})
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -331,7 +336,7 @@ class TestBookstackRequestFormHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> None:
             raise requests.exceptions.Timeout("Connection timed out")
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -348,7 +353,7 @@ class TestBookstackRequestFormHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> None:
             raise requests.exceptions.ConnectionError("Failed to connect")
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -377,7 +382,7 @@ class TestBookstackRequestFormHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> NonJSONResponse:
             return NonJSONResponse()
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -394,7 +399,7 @@ class TestBookstackRequestFormHTTPErrors:
         def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
             return FakeResponse(404, {"message": "Image ID 999 not found in gallery"})
 
-        monkeypatch.setattr("requests.request", fake_request)
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
         monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
         monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
 
@@ -403,3 +408,226 @@ class TestBookstackRequestFormHTTPErrors:
 
         error_msg = str(exc.value)
         assert "Image ID 999 not found" in error_msg
+
+    def test_form_request_drops_json_content_type(self, monkeypatch: MonkeyPatch) -> None:
+        """Test form requests let requests set the multipart Content-Type."""
+        shared_headers = {
+            "Authorization": "Token test",
+            "Content-Type": "application/json",
+        }
+        sent_headers = []
+
+        def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
+            sent_headers.append(kwargs["headers"])
+            return FakeResponse(200, {"id": 1})
+
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
+        monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
+        monkeypatch.setattr(tools, "_bookstack_headers", lambda: shared_headers)
+
+        tools._bookstack_request_form("POST", "/api/image-gallery")
+        tools._bookstack_request_form("POST", "/api/image-gallery")
+
+        assert sent_headers[0] == {"Authorization": "Token test"}
+        assert sent_headers[1] is sent_headers[0]
+        assert shared_headers["Content-Type"] == "application/json"
+
+    def test_form_upload_streams_multipart_body(self, monkeypatch: MonkeyPatch) -> None:
+        """Test file uploads are sent through a streaming multipart encoder."""
+        pytest.importorskip("requests_toolbelt")
+        sent = {}
+
+        def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
+            sent.update(kwargs)
+            return FakeResponse(200, {"id": 1})
+
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
+        monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
+        monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
+
+        tools._bookstack_request_form(
+            "POST",
+            "/api/image-gallery",
+            data={"type": "gallery", "uploaded_to": 7, "name": None},
+            files={"image": ("cat.png", b"\x89PNG", "image/png")},
+        )
+
+        assert "files" not in sent
+        encoder = sent["data"]
+        assert sent["headers"]["Content-Type"] == encoder.content_type
+        assert encoder.content_type.startswith("multipart/form-data; boundary=")
+        body = encoder.to_string()
+        assert b'name="uploaded_to"\r\n\r\n7\r\n' in body
+        assert b'name="name"' not in body
+        assert b'filename="cat.png"' in body and b"\x89PNG" in body
+
+    def test_retried_put_upload_sends_complete_body(self, monkeypatch: MonkeyPatch) -> None:
+        """Test that a PUT upload replayed after a 503 carries the whole multipart body."""
+        bodies: list = []
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            timeout = 2
+
+            def do_PUT(self) -> None:
+                expected = int(self.headers["Content-Length"])
+                received = b""
+                try:
+                    while len(received) < expected:
+                        chunk = self.rfile.read(expected - len(received))
+                        if not chunk:
+                            break
+                        received += chunk
+                except OSError:
+                    pass
+                bodies.append((expected, received))
+                status = 503 if len(bodies) == 1 else 200
+                payload = json.dumps({"id": 1}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            monkeypatch.setattr(Retry, "get_backoff_time", lambda self: 0)
+            result = api_client._bookstack_request_form(
+                "PUT",
+                "/api/image-gallery/1",
+                data={"name": "cat"},
+                files={"image": ("cat.png", b"\x89PNG" + b"x" * 5000, "image/png")},
+                _base_url_fn=lambda: f"http://127.0.0.1:{server.server_address[1]}",
+                _headers_fn=lambda: {"Authorization": "Token test"},
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert result == {"id": 1}
+        assert len(bodies) == 2
+        for expected, received in bodies:
+            assert len(received) == expected
+            assert b"\x89PNG" + b"x" * 5000 in received
+
+
+class TestRetryPolicy:
+    """Test the shared session's retry policy."""
+
+    def test_post_is_not_retried(self) -> None:
+        """Test that non-idempotent creates are never replayed."""
+        assert "POST" not in api_client._RETRY_POLICY.allowed_methods
+        assert "GET" in api_client._RETRY_POLICY.allowed_methods
+
+    def test_backoff_adds_bounded_jitter(self, monkeypatch: MonkeyPatch) -> None:
+        """Test that backoff is jittered upwards and capped."""
+        monkeypatch.setattr(Retry, "get_backoff_time", lambda self: 8.0)
+        retry = api_client._JitteredRetry(total=3)
+        delays = {retry.get_backoff_time() for _ in range(20)}
+        assert all(8.0 <= delay <= 12.0 for delay in delays)
+        assert len(delays) > 1
+
+        monkeypatch.setattr(Retry, "get_backoff_time", lambda self: 40.0)
+        assert retry.get_backoff_time() == api_client._JitteredRetry.MAX_BACKOFF_SECONDS
+
+    def test_zero_backoff_stays_zero(self, monkeypatch: MonkeyPatch) -> None:
+        """Test that the first retry is not delayed by jitter."""
+        monkeypatch.setattr(Retry, "get_backoff_time", lambda self: 0)
+        assert api_client._JitteredRetry(total=3).get_backoff_time() == 0.0
+
+    def test_image_fetch_session_does_not_retry(self) -> None:
+        """Test that downloads from user-supplied hosts are never retried."""
+        fetch_session = api_client._get_fetch_session()
+        assert fetch_session is not api_client._get_session()
+        assert fetch_session.get_adapter("https://example.com").max_retries.total == 0
+
+    def test_sessions_do_not_keep_cookies(self) -> None:
+        """Test that cookies set by one response are not replayed later."""
+        cookie = requests.cookies.create_cookie("session", "abc", domain="example.com")
+        request = urllib.request.Request("https://example.com/")
+        for session in (api_client._get_session(), api_client._get_fetch_session()):
+            policy = session.cookies.get_policy()
+            assert not policy.set_ok(cookie, request)
+
+    def test_sessions_are_closed_at_exit(self, monkeypatch: MonkeyPatch) -> None:
+        """Test that each pooled session registers its close for interpreter exit."""
+        registered = []
+        monkeypatch.setattr(api_client.atexit, "register", registered.append)
+
+        session = api_client._build_session()
+
+        assert registered == [session.close]
+
+
+class TestCircuitBreaker:
+    """Test fail-fast behaviour during BookStack outages."""
+
+    def _patch_unreachable(self, monkeypatch: MonkeyPatch, calls: list) -> None:
+        def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
+            calls.append(url)
+            raise requests.ConnectionError("connection refused")
+
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
+        monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
+        monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
+
+    def test_opens_after_consecutive_transport_failures(self, monkeypatch: MonkeyPatch) -> None:
+        """Test that calls fail fast without touching the network once the circuit opens."""
+        calls: list = []
+        self._patch_unreachable(monkeypatch, calls)
+        fail_max = api_client._CIRCUIT_BREAKER.fail_max
+
+        for _ in range(fail_max):
+            with pytest.raises(ToolError, match="Unable to reach"):
+                tools._bookstack_request("DELETE", "/api/pages/1")
+
+        with pytest.raises(ToolError, match="temporarily unavailable"):
+            tools._bookstack_request("DELETE", "/api/pages/1")
+        assert len(calls) == fail_max
+
+    def test_half_opens_after_cooldown(self, monkeypatch: MonkeyPatch) -> None:
+        """Test that a request is attempted again once the cooldown has elapsed."""
+        calls: list = []
+        self._patch_unreachable(monkeypatch, calls)
+        monkeypatch.setattr(api_client._CIRCUIT_BREAKER, "reset_timeout", 0)
+
+        for _ in range(api_client._CIRCUIT_BREAKER.fail_max + 1):
+            with pytest.raises(ToolError, match="Unable to reach"):
+                tools._bookstack_request("DELETE", "/api/pages/1")
+        assert len(calls) == api_client._CIRCUIT_BREAKER.fail_max + 1
+
+    def test_half_open_admits_a_single_probe(self) -> None:
+        """Test that only one caller is let through while the circuit is half-open."""
+        breaker = api_client._CircuitBreaker(fail_max=1, reset_timeout=30)
+        breaker.record_failure()
+        breaker._opened_at -= 31
+
+        assert breaker.retry_after() is None
+        assert breaker.retry_after() is not None
+
+        breaker.record_failure()
+        assert breaker.retry_after() is not None
+
+        breaker._opened_at -= 31
+        assert breaker.retry_after() is None
+        breaker.record_success()
+        assert breaker.retry_after() is None
+        assert breaker.retry_after() is None
+
+    def test_http_errors_do_not_open_circuit(self, monkeypatch: MonkeyPatch) -> None:
+        """Test that HTTP error responses count as a reachable API."""
+
+        def fake_request(method: str, url: str, **kwargs: Any) -> FakeResponse:
+            return FakeResponse(500, {"error": "boom"})
+
+        monkeypatch.setattr(tools._get_session(), "request", fake_request)
+        monkeypatch.setattr(tools, "_bookstack_base_url", lambda: "https://test.example.com")
+        monkeypatch.setattr(tools, "_bookstack_headers", lambda: {"Authorization": "Token test"})
+
+        for _ in range(api_client._CIRCUIT_BREAKER.fail_max + 1):
+            with pytest.raises(ToolError, match="HTTP 500"):
+                tools._bookstack_request("DELETE", "/api/pages/1")
@@ -236,3 +236,26 @@ async def test_chapters_listing_with_pagination(monkeypatch: MonkeyPatch) -> Non
     assert data["metadata"]["total"] == 50
     assert data["metadata"]["returned"] == 3
     assert len(data["data"]["data"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_unscoped_listing_prefetches_next_page(monkeypatch: MonkeyPatch) -> None:
+    """Test that the following page is requested in the background when enabled."""
+    mcp = FastMCP("test")
+    register_bookstack_tools(mcp)
+
+    calls: list[Dict[str, Any]] = []
+
+    def fake_request(method: str, path: str, *, params=None, **kwargs) -> Dict[str, Any]:
+        calls.append(dict(params))
+        return {"data": [{"id": 1}, {"id": 2}], "total": 5}
+
+    monkeypatch.setattr(tools, "_bookstack_request", fake_request)
+    monkeypatch.setattr(tools, "_LIST_PREFETCH_WORKERS", 1)
+    monkeypatch.setattr(tools, "_prefetch_pool", None)
+
+    tool = await mcp.get_tool("bookstack_list_content")
+    await tool.run({"entity_type": "pages", "offset": 0, "count": 2})
+    tools._prefetch_pool.shutdown(wait=True)
+
+    assert [(c["offset"], c["count"]) for c in calls] == [(0, 2), (2, 2)]
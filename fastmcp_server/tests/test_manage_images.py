@@ -242,7 +242,7 @@ async def test_image_create_from_url(monkeypatch: MonkeyPatch) -> None:
         assert mime_type == "image/png"
         return payload
 
-    monkeypatch.setattr("requests.get", fake_get)
+    monkeypatch.setattr(tools._get_fetch_session(), "get", fake_get)
     monkeypatch.setattr(tools, "_bookstack_request_form", fake_form)
 
     tool = await mcp.get_tool("bookstack_manage_images")
@@ -291,7 +291,7 @@ async def test_image_create_from_url_with_mime_fallback(monkeypatch: MonkeyPatch
         }
         return payload
 
-    monkeypatch.setattr("requests.get", fake_get)
+    monkeypatch.setattr(tools._get_fetch_session(), "get", fake_get)
     monkeypatch.setattr(tools, "_bookstack_request_form", fake_form)
 
     tool = await mcp.get_tool("bookstack_manage_images")
@@ -325,7 +325,7 @@ async def test_image_create_from_url_rejects_unsupported_content_type(monkeypatc
     def fake_get(url, **kwargs):
         return FakeResponse()
 
-    monkeypatch.setattr("requests.get", fake_get)
+    monkeypatch.setattr(tools._get_fetch_session(), "get", fake_get)
 
     tool = await mcp.get_tool("bookstack_manage_images")
 
@@ -359,7 +359,7 @@ async def test_image_create_from_url_rejects_missing_mime_without_image_extensio
     def fake_get(url, **kwargs):
         return FakeResponse()
 
-    monkeypatch.setattr("requests.get", fake_get)
+    monkeypatch.setattr(tools._get_fetch_session(), "get", fake_get)
 
     tool = await mcp.get_tool("bookstack_manage_images")
 
@@ -385,7 +385,7 @@ async def test_image_create_from_url_timeout(monkeypatch: MonkeyPatch) -> None:
     def fake_get(url, **kwargs):
         raise requests.exceptions.Timeout("Connection timeout")
 
-    monkeypatch.setattr("requests.get", fake_get)
+    monkeypatch.setattr(tools._get_fetch_session(), "get", fake_get)
 
     tool = await mcp.get_tool("bookstack_manage_images")
 
@@ -416,7 +416,7 @@ async def test_image_create_from_url_too_large(monkeypatch: MonkeyPatch) -> None
     def fake_get(url, **kwargs):
         return FakeResponse()
 
-    monkeypatch.setattr("requests.get", fake_get)
+    monkeypatch.setattr(tools._get_fetch_session(), "get", fake_get)
 
     tool = await mcp.get_tool("bookstack_manage_images")
 
@@ -459,7 +459,7 @@ async def test_image_create_from_url_rejects_loopback_target(monkeypatch: Monkey
     mcp = FastMCP("test")
     register_bookstack_tools(mcp)
 
-    monkeypatch.setattr("requests.get", pytest.fail)
+    monkeypatch.setattr(tools._get_fetch_session(), "get", pytest.fail)
 
     tool = await mcp.get_tool("bookstack_manage_images")
 
@@ -480,7 +480,7 @@ async def test_image_create_from_url_rejects_private_dns_result(monkeypatch: Mon
     mcp = FastMCP("test")
     register_bookstack_tools(mcp)
 
-    monkeypatch.setattr("requests.get", pytest.fail)
+    monkeypatch.setattr(tools._get_fetch_session(), "get", pytest.fail)
 
     tool = await mcp.get_tool("bookstack_manage_images")
 
@@ -517,7 +517,7 @@ async def test_image_create_from_url_rejects_redirect_to_loopback(monkeypatch: M
         request_urls.append(url)
         return RedirectResponse()
 
-    monkeypatch.setattr("requests.get", fake_get)
+    monkeypatch.setattr(tools._get_fetch_session(), "get", fake_get)
 
     tool = await mcp.get_tool("bookstack_manage_images")
 
@@ -550,7 +550,7 @@ async def test_image_create_from_url_http_error(monkeypatch: MonkeyPatch) -> Non
     def fake_get(url, **kwargs):
         return FakeResponse()
 
-    monkeypatch.setattr("requests.get", fake_get)
+    monkeypatch.setattr(tools._get_fetch_session(), "get", fake_get)
 
     tool = await mcp.get_tool("bookstack_manage_images")
 
@@ -595,7 +595,7 @@ async def test_image_create_from_url_with_custom_target(monkeypatch: MonkeyPatch
         assert "image" in files
         return payload
 
-    monkeypatch.setattr("requests.get", fake_get)
+    monkeypatch.setattr(tools._get_fetch_session(), "get", fake_get)
     monkeypatch.setattr(tools, "_bookstack_request_form", fake_form)
 
     tool = await mcp.get_tool("bookstack_manage_images")
@@ -643,7 +643,7 @@ async def test_image_update_with_url(monkeypatch: MonkeyPatch) -> None:
         assert mime_type == "image/webp"
         return payload
 
-    monkeypatch.setattr("requests.get", fake_get)
+    monkeypatch.setattr(tools._get_fetch_session(), "get", fake_get)
     monkeypatch.setattr(tools, "_bookstack_request_form", fake_form)
 
     tool = await mcp.get_tool("bookstack_manage_images")
@@ -686,7 +686,7 @@ async def test_url_filename_extraction(monkeypatch: MonkeyPatch) -> None:
             captured_filenames.append(files["image"][0])
         return payload
 
-    monkeypatch.setattr("requests.get", fake_get)
+    monkeypatch.setattr(tools._get_fetch_session(), "get", fake_get)
     monkeypatch.setattr(tools, "_bookstack_request_form", fake_form)
 
     tool = await mcp.get_tool("bookstack_manage_images")
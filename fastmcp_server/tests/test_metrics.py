@@ -203,6 +203,18 @@ class TestMetricsCollector:
         assert summary["error_count"] == 2
         assert "50.00%" in summary["error_rate"]
 
+    def test_get_summary_totals_track_buffer_window(self, metrics_collector):
+        """Test that summary totals drop requests once they leave the buffer."""
+        metrics_collector.record_request("GET", "/api/books", 9.0, 500, error="old")
+        for _ in range(10000):
+            metrics_collector.record_request("GET", "/api/books", 0.001, 200)
+
+        summary = metrics_collector.get_summary()
+
+        assert summary["total_requests"] == 10000
+        assert summary["error_count"] == 0
+        assert summary["avg_duration_ms"] == "1.00"
+
     def test_get_tool_metrics_returns_dict(self, metrics_collector):
         """Test that get_tool_metrics returns tool stats as dict."""
         metrics_collector.record_tool_call("tool1", 0.5, True)
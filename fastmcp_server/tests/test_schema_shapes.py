@@ -64,3 +64,23 @@ async def test_batch_operations_data_schema_references() -> None:
         entry.get("unevaluatedProperties") is False
         for entry in one_of_entries[:4]
     )
+
+
+@pytest.mark.asyncio
+async def test_optional_schema_fragments_not_mutated_by_registration() -> None:
+    from fastmcp_server.bookstack import schemas
+
+    fragments = (
+        schemas._OPTIONAL_INT_SCHEMA,
+        schemas._OPTIONAL_STRING_SCHEMA,
+        schemas._OPTIONAL_STRING_NO_MIN_SCHEMA,
+    )
+    snapshot = [repr(fragment) for fragment in fragments]
+
+    mcp = FastMCP("test")
+    register_bookstack_tools(mcp)
+    for tool in (await mcp.get_tools()).values():
+        tool.to_mcp_tool().model_dump(mode="json")
+
+    assert [repr(fragment) for fragment in fragments] == snapshot
+    assert all("description" not in fragment for fragment in fragments)
@@ -155,6 +155,14 @@ async def test_search_preview_html_content_extraction(monkeypatch: MonkeyPatch)
     assert "steps" in first["summary"]
 
 
+def test_trim_summary_handles_unclosed_angle_brackets() -> None:
+    """Stray '<' characters are kept and do not swallow following tags."""
+    from fastmcp_server.bookstack.content_operations import _trim_summary
+
+    assert _trim_summary("a < b <em>and</em> c") == "a < b and c"
+    assert _trim_summary("x < " * 5000).startswith("x < x <")
+
+
 @pytest.mark.asyncio
 async def test_search_count_and_page_params_forwarded(monkeypatch: MonkeyPatch) -> None:
     """Test that count and page parameters are correctly forwarded to API."""
@@ -227,3 +235,23 @@ async def test_search_with_description_field(monkeypatch: MonkeyPatch) -> None:
     # Description should be used as summary when preview_html is not present
     assert "summary" in first
     assert "overview of the system" in first["summary"]
+
+
+@pytest.mark.asyncio
+async def test_search_limit_counts_only_dict_items(monkeypatch: MonkeyPatch) -> None:
+    """Test that malformed entries do not use up the result limit."""
+    mcp = FastMCP("test")
+    register_bookstack_tools(mcp)
+
+    response = {
+        "total": 4,
+        "data": ["bad", {"id": 1, "type": "page"}, None, {"id": 2, "type": "page"}, {"id": 3, "type": "page"}],
+    }
+    monkeypatch.setattr(tools, "_bookstack_request", lambda *args, **kwargs: response)
+
+    tool = await mcp.get_tool("bookstack_search")
+    result = await tool.run({"query": "limit", "count": 2})
+
+    data = json.loads(result.content[0].text)
+    assert [item["id"] for item in data["results"]] == [1, 2]
+    assert data["returned"] == 2
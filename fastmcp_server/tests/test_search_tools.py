@@ -184,3 +184,27 @@ def test_attach_entity_summary_ignores_missing_page_ids() -> None:
 
     result = tools._attach_entity_summary(payload)
     assert "entities" not in result
+
+
+@pytest.mark.asyncio
+async def test_image_search_reuses_list_cache(monkeypatch: MonkeyPatch) -> None:
+    tools._invalidate_list_cache()
+    mcp = FastMCP("test")
+    register_bookstack_tools(mcp)
+
+    calls = []
+
+    def fake_request(method: str, path: str, *, params=None, json=None):
+        calls.append(params)
+        return {"data": [{"id": 4, "name": "logo.svg"}], "total": 1}
+
+    monkeypatch.setattr(tools, "_bookstack_request", fake_request)
+
+    tool = await mcp.get_tool("bookstack_search_images")
+    first = json.loads((await tool.run({"query": "logo", "extension": "svg"})).content[0].text)
+    second = json.loads((await tool.run({"query": "logo", "extension": "svg"})).content[0].text)
+
+    assert len(calls) == 1
+    assert first["metadata"].get("cached") is None
+    assert second["metadata"]["cached"] is True
+    assert second["data"] == first["data"]
@@ -41,7 +41,7 @@ async def test_semantic_search_happy_path(monkeypatch: MonkeyPatch) -> None:
         assert json["query"] == "test query"
         return FakeResponse(fake_response)
 
-    monkeypatch.setattr("fastmcp_server.bookstack.tools.requests.post", fake_post)
+    monkeypatch.setattr(tools._get_session(), "post", fake_post)
     monkeypatch.setenv("HAYHOOKS_SEARCH_URL", "http://test-hayhooks:1416/search")
 
     tool = await mcp.get_tool("bookstack_semantic_search")
@@ -74,7 +74,7 @@ async def test_semantic_search_default_params(monkeypatch: MonkeyPatch) -> None:
         captured_payload.update(json)
         return FakeResponse()
 
-    monkeypatch.setattr("fastmcp_server.bookstack.tools.requests.post", fake_post)
+    monkeypatch.setattr(tools._get_session(), "post", fake_post)
     monkeypatch.setenv("HAYHOOKS_SEARCH_URL", "http://test-hayhooks:1416/search")
 
     tool = await mcp.get_tool("bookstack_semantic_search")
@@ -108,7 +108,7 @@ async def test_semantic_search_custom_params(monkeypatch: MonkeyPatch) -> None:
         captured_payload.update(json)
         return FakeResponse()
 
-    monkeypatch.setattr("fastmcp_server.bookstack.tools.requests.post", fake_post)
+    monkeypatch.setattr(tools._get_session(), "post", fake_post)
     monkeypatch.setenv("HAYHOOKS_SEARCH_URL", "http://test-hayhooks:1416/search")
 
     tool = await mcp.get_tool("bookstack_semantic_search")
@@ -147,7 +147,7 @@ async def test_semantic_search_invalid_response_mode_fallback(monkeypatch: Monke
         captured_payload.update(json)
         return FakeResponse()
 
-    monkeypatch.setattr("fastmcp_server.bookstack.tools.requests.post", fake_post)
+    monkeypatch.setattr(tools._get_session(), "post", fake_post)
     monkeypatch.setenv("HAYHOOKS_SEARCH_URL", "http://test-hayhooks:1416/search")
 
     tool = await mcp.get_tool("bookstack_semantic_search")
@@ -181,7 +181,7 @@ async def test_semantic_search_invalid_score_threshold_fallback(monkeypatch: Mon
         captured_payload.update(json)
         return FakeResponse()
 
-    monkeypatch.setattr("fastmcp_server.bookstack.tools.requests.post", fake_post)
+    monkeypatch.setattr(tools._get_session(), "post", fake_post)
     monkeypatch.setenv("HAYHOOKS_SEARCH_URL", "http://test-hayhooks:1416/search")
 
     tool = await mcp.get_tool("bookstack_semantic_search")
@@ -224,7 +224,7 @@ async def test_semantic_search_book_filter_mapped(monkeypatch: MonkeyPatch) -> N
         captured_payload.update(json)
         return FakeResponse()
 
-    monkeypatch.setattr("fastmcp_server.bookstack.tools.requests.post", fake_post)
+    monkeypatch.setattr(tools._get_session(), "post", fake_post)
     monkeypatch.setenv("HAYHOOKS_SEARCH_URL", "http://test-hayhooks:1416/search")
 
     tool = await mcp.get_tool("bookstack_semantic_search")
@@ -247,7 +247,7 @@ async def test_semantic_search_timeout_raises_error(monkeypatch: MonkeyPatch) ->
     def fake_post(url: str, json: Dict[str, Any], timeout: int, headers: Dict[str, str]):
         raise requests.exceptions.Timeout("Request timed out")
 
-    monkeypatch.setattr("fastmcp_server.bookstack.tools.requests.post", fake_post)
+    monkeypatch.setattr(tools._get_session(), "post", fake_post)
     monkeypatch.setenv("HAYHOOKS_SEARCH_URL", "http://test-hayhooks:1416/search")
 
     tool = await mcp.get_tool("bookstack_semantic_search")
@@ -269,7 +269,7 @@ async def test_semantic_search_connection_error_raises_error(monkeypatch: Monkey
     def fake_post(url: str, json: Dict[str, Any], timeout: int, headers: Dict[str, str]):
         raise requests.exceptions.ConnectionError("Failed to connect")
 
-    monkeypatch.setattr("fastmcp_server.bookstack.tools.requests.post", fake_post)
+    monkeypatch.setattr(tools._get_session(), "post", fake_post)
     monkeypatch.setenv("HAYHOOKS_SEARCH_URL", "http://test-hayhooks:1416/search")
 
     tool = await mcp.get_tool("bookstack_semantic_search")
@@ -299,7 +299,7 @@ async def test_semantic_search_http_error_raises_error(monkeypatch: MonkeyPatch)
     def fake_post(url: str, json: Dict[str, Any], timeout: int, headers: Dict[str, str]):
         return FakeResponse()
 
-    monkeypatch.setattr("fastmcp_server.bookstack.tools.requests.post", fake_post)
+    monkeypatch.setattr(tools._get_session(), "post", fake_post)
     monkeypatch.setenv("HAYHOOKS_SEARCH_URL", "http://test-hayhooks:1416/search")
 
     tool = await mcp.get_tool("bookstack_semantic_search")
@@ -330,7 +330,7 @@ async def test_semantic_search_non_json_response_raises_error(monkeypatch: Monke
     def fake_post(url: str, json: Dict[str, Any], timeout: int, headers: Dict[str, str]):
         return FakeResponse()
 
-    monkeypatch.setattr("fastmcp_server.bookstack.tools.requests.post", fake_post)
+    monkeypatch.setattr(tools._get_session(), "post", fake_post)
     monkeypatch.setenv("HAYHOOKS_SEARCH_URL", "http://test-hayhooks:1416/search")
 
     tool = await mcp.get_tool("bookstack_semantic_search")
@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import json
+import threading
 
 import pytest
 from fastmcp import FastMCP
 from pytest import MonkeyPatch
 
 import fastmcp_server.bookstack.tools_simplified as simplified_tools
+from fastmcp_server.bookstack.api_client import ToolError
 from fastmcp_server.bookstack.tools_simplified import register_simplified_bookstack_tools
 
 
@@ -86,3 +88,94 @@ async def test_simplified_batch_create_page_strips_placeholder(monkeypatch: Monk
     assert response["success_count"] == 1
     payload = response["results"][0]["payload"]
     assert payload == {"name": "Dry Run Page", "book_id": 33, "markdown": "Dry run"}
+
+
+@pytest.mark.asyncio
+async def test_simplified_batch_delete_reports_results_in_item_order(monkeypatch: MonkeyPatch) -> None:
+    mcp = FastMCP("test")
+    register_simplified_bookstack_tools(mcp)
+
+    def fake_request(method: str, path: str, **kwargs):
+        if path.endswith("/2"):
+            raise simplified_tools.ToolError("Not found")
+        return {"deleted": path}
+
+    monkeypatch.setattr(simplified_tools, "_bookstack_request", fake_request)
+    monkeypatch.setattr(simplified_tools, "_BATCH_MAX_WORKERS", 4)
+
+    tool = await mcp.get_tool("bookstack_batch_operations")
+    result = await tool.run(
+        {
+            "operation": "bulk_delete",
+            "entity_type": "page",
+            "items": [{"id": item_id} for item_id in range(1, 6)],
+        }
+    )
+
+    response = json.loads(result.content[0].text)
+    assert [entry["index"] for entry in response["results"]] == [0, 2, 3, 4]
+    assert response["results"][0]["result"] == {"deleted": "/api/pages/1"}
+    assert response["errors"] == [{"index": 1, "error": "Not found"}]
+
+
+@pytest.mark.asyncio
+async def test_simplified_batch_create_stays_sequential(monkeypatch: MonkeyPatch) -> None:
+    mcp = FastMCP("test")
+    register_simplified_bookstack_tools(mcp)
+
+    calls = []
+
+    def fake_request(method: str, path: str, *, json=None, **kwargs):
+        calls.append((json["name"], threading.get_ident()))
+        return {"id": len(calls)}
+
+    monkeypatch.setattr(simplified_tools, "_bookstack_request", fake_request)
+    monkeypatch.setattr(simplified_tools, "_BATCH_MAX_WORKERS", 4)
+
+    tool = await mcp.get_tool("bookstack_batch_operations")
+    await tool.run(
+        {
+            "operation": "bulk_create",
+            "entity_type": "book",
+            "items": [{"data": {"name": f"Book {n}", "description": "d"}} for n in range(5)],
+        }
+    )
+
+    assert [name for name, _ in calls] == [f"Book {n}" for n in range(5)]
+    assert {thread for _, thread in calls} == {threading.get_ident()}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("workers", [1, 4])
+async def test_simplified_batch_errors_handled_alike_in_both_paths(monkeypatch: MonkeyPatch, workers: int) -> None:
+    mcp = FastMCP("test")
+    register_simplified_bookstack_tools(mcp)
+
+    def fake_request(method: str, path: str, **kwargs):
+        if path.endswith("/2"):
+            raise TypeError("unexpected keyword argument 'bogus'")
+        if path.endswith("/3"):
+            raise RuntimeError("boom")
+        return {"deleted": path}
+
+    monkeypatch.setattr(simplified_tools, "_bookstack_request", fake_request)
+    monkeypatch.setattr(simplified_tools, "_BATCH_MAX_WORKERS", workers)
+    tool = await mcp.get_tool("bookstack_batch_operations")
+
+    with pytest.raises(ToolError, match="Correct batch format"):
+        await tool.run({"operation": "bulk_delete", "entity_type": "page", "items": [{"id": 1}, {"id": 2}]})
+
+    result = await tool.run({"operation": "bulk_delete", "entity_type": "page", "items": [{"id": 1}, {"id": 3}]})
+    response = json.loads(result.content[0].text)
+    assert response["errors"] == [{"index": 1, "error": "boom"}]
+
+
+def test_prepare_simplified_fields_leaves_input_untouched() -> None:
+    data = {"name": "Page", "book_id": "12", "chapter_id": 0, "tags": [{"name": "a", "value": "b"}]}
+
+    merged, updates = simplified_tools._prepare_simplified_fields(data, {})
+
+    assert merged["book_id"] == 12
+    assert updates is not None and updates["book_id"] == 12 and "chapter_id" not in updates
+    assert updates["tags"] is data["tags"]
+    assert data == {"name": "Page", "book_id": "12", "chapter_id": 0, "tags": [{"name": "a", "value": "b"}]}
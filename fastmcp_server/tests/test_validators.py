@@ -165,6 +165,27 @@ class TestInputValidatorXSS:
         assert result == "<script>console.log('dev')</script>"
 
 
+class TestInputValidatorMarkdown:
+    """Test markdown validation of embedded HTML."""
+
+    def test_allows_plain_markdown(self) -> None:
+        text = "# Title\n\nSome *text* with a [link](https://example.com)."
+        assert InputValidator.validate_markdown(text, "markdown") == text
+
+    def test_allows_benign_inline_html(self) -> None:
+        text = "Line one<br>\n<details><summary>More</summary>Body</details>"
+        assert InputValidator.validate_markdown(text, "markdown") == text
+
+    def test_rejects_event_handler_in_tag(self) -> None:
+        with pytest.raises(ValidationError) as exc:
+            InputValidator.validate_markdown('<img src="x" onerror="alert(1)">', "markdown")
+        assert "malicious HTML" in str(exc.value)
+
+    def test_ignores_handler_text_outside_tags(self) -> None:
+        text = "Set onload = true in the config file."
+        assert InputValidator.validate_markdown(text, "markdown") == text
+
+
 class TestInputValidatorPathTraversal:
     """Test path traversal detection."""
 